@@ -10,8 +10,7 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from awscleanup.core.application import AWSCleanupApp
-from awscleanup.utils.cli import setup_argument_parser, validate_environment
+from awscleanup.utils.cli import setup_argument_parser, setup_logging, validate_environment
 
 
 def main():
@@ -23,13 +22,18 @@ def main():
     # Validate environment
     validate_environment()
     
-    # Create and run application
+    # Create and run application; imported only now, so --help and a failed
+    # environment check don't pay for loading the whole tool
+    from awscleanup.core.application import AWSCleanupApp
     app = AWSCleanupApp()
     
+    # Service errors go to a log file; anything on stderr would land on top of the UI
+    setup_logging(app.settings.config_dir / 'cleanup.log')
+    
     # Override settings based on command line args
     if args.color_scheme:
         app.settings.ui_settings['color_scheme'] = args.color_scheme
-        app.ui = type(app.ui)(args.color_scheme)
+        app.ui = type(app.ui)(args.color_scheme, app.settings.ui_settings['animation_speed'])
     
     if args.easter_eggs:
         app.settings.ui_settings['easter_eggs'] = True
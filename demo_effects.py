@@ -54,7 +54,9 @@ def main():
     # Matrix rain effect
     RetroEffects.matrix_rain(terminal.width, terminal.height, 5.0)
     
+    # clear_screen only queues the sequence; send it before printing past the buffer
     terminal.clear_screen()
+    terminal.flush()
     print(f"{colors.success}Demo complete! Ready to clean some cloud resources! ☁️{Color.RESET}")
     print(f"{colors.info}Run './aws_cleanup_retro.py' to start the real application.{Color.RESET}")
 
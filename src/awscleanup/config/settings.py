@@ -12,8 +12,10 @@ from ..core.models import ServiceConfig
 class Settings:
     """Application settings and configuration."""
     
+    # Shared with services that keep their own state files alongside the config
+    config_dir = Path.home() / '.aws'
+    
     def __init__(self):
-        self.config_dir = Path.home() / '.aws'
         self.service_config_file = self.config_dir / 'cleanup_services.conf'
         self.ui_config_file = self.config_dir / 'cleanup_ui.conf'
         
@@ -33,7 +35,7 @@ class Settings:
         # UI settings
         self.ui_settings = {
             'retro_mode': True,
-            'animation_speed': 'normal',  # slow, normal, fast
+            'animation_speed': 'normal',  # slow, normal, fast, off
             'sound_effects': False,
             'color_scheme': 'neon',  # neon, classic, matrix
             'easter_eggs': True,
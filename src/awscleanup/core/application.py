@@ -2,8 +2,12 @@
 Main application controller for AWS Cleanup Tool.
 """
 
+import logging
 import sys
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, List, Optional
 from .models import CleanupSession, MenuItem, AWSResource
 from .profile_manager import AWSProfileManager
 from .discovery import ResourceDiscovery
@@ -11,24 +15,34 @@ from .exceptions import AccountSecurityError, ProfileError
 from ..config.settings import Settings
 from ..ui.retro_ui import RetroUI
 from ..ui.colors import Color
+from ..services.base import BaseAWSService
 from ..services.service_factory import ServiceFactory
 from ..services.billing_service import BillingService
 
 
+logger = logging.getLogger(__name__)
+
+
 class AWSCleanupApp:
     """Main application controller."""
     
     def __init__(self):
         self.settings = Settings()
         self.profile_manager = AWSProfileManager()
-        self.ui = RetroUI(self.settings.ui_settings['color_scheme'])
+        self.ui = RetroUI(self.settings.ui_settings['color_scheme'], self.settings.ui_settings['animation_speed'])
         self.session: Optional[CleanupSession] = None
         self.discovery: Optional[ResourceDiscovery] = None
         self.billing_service: Optional[BillingService] = None
+        # Account lookups for the profile menu, started before the splash screen
+        self._profile_accounts: Optional[Dict[str, Future]] = None
         
     def run(self, profile: str = None) -> None:
         """Run the application."""
         try:
+            if not profile:
+                # STS round trips for every profile overlap with the splash animation
+                self._profile_accounts = self._start_account_lookups(self.profile_manager.get_available_profiles())
+            
             self.ui.show_splash_screen()
             
             # Initialize session
@@ -42,7 +56,8 @@ class AWSCleanupApp:
         except Exception as e:
             self.ui.show_message(f"Fatal error: {e}", "error", 3.0)
         finally:
-            print("\nGoodbye! 👋")
+            self.ui.terminal.write("\nGoodbye! 👋\n")
+            self.ui.terminal.flush()
     
     def _initialize_session(self, profile: str = None) -> None:
         """Initialize the cleanup session."""
@@ -88,6 +103,18 @@ class AWSCleanupApp:
             self.ui.show_message(f"Profile Error: {e}", "error", 3.0)
             sys.exit(1)
     
+    def _start_account_lookups(self, profiles: List[str]) -> Dict[str, Future]:
+        """Start looking up the account behind each profile in the background."""
+        if len(profiles) < 2:
+            # A single profile is used without showing the menu
+            return {}
+        
+        executor = ThreadPoolExecutor(max_workers=min(8, len(profiles)))
+        try:
+            return {profile: executor.submit(self.profile_manager.get_account_info, profile) for profile in profiles}
+        finally:
+            executor.shutdown(wait=False)
+    
     def _select_profile_interactive(self) -> str:
         """Interactive profile selection."""
         profiles = self.profile_manager.get_available_profiles()
@@ -95,11 +122,16 @@ class AWSCleanupApp:
         if len(profiles) == 1:
             return profiles[0]
         
+        # Lookups started at launch are only good for the first menu
+        accounts, self._profile_accounts = self._profile_accounts, None
+        if accounts is None or set(accounts) != set(profiles):
+            accounts = self._start_account_lookups(profiles)
+        
         # Create menu items for profiles
         menu_items = []
         for i, profile in enumerate(profiles):
             try:
-                account_info = self.profile_manager.get_account_info(profile)
+                account_info = accounts[profile].result()
                 label = f"{profile:<20} (Account: {account_info.account_id})"
                 menu_items.append(MenuItem(
                     label=label,
@@ -129,7 +161,7 @@ class AWSCleanupApp:
                     prefix = f"{color}  {item.label}{Color.RESET}"
                 
                 self.ui.terminal.move_cursor(x, y)
-                print(prefix)
+                self.ui.terminal.write(prefix)
             
             key = self.ui.terminal.get_key()
             
@@ -157,14 +189,14 @@ class AWSCleanupApp:
         available_popular = [r for r in popular_regions if r in regions]
         
         self.ui.terminal.clear_screen()
-        print(f"\n{self.ui.colors.accent}┌─ Region Selection ─┐{Color.RESET}")
-        print(f"{self.ui.colors.info}Profile '{profile}' needs a default region.{Color.RESET}")
-        print(f"\n{self.ui.colors.accent}Popular regions:{Color.RESET}")
+        self.ui.terminal.write(f"\n{self.ui.colors.accent}┌─ Region Selection ─┐{Color.RESET}\n")
+        self.ui.terminal.write(f"{self.ui.colors.info}Profile '{profile}' needs a default region.{Color.RESET}\n")
+        self.ui.terminal.write(f"\n{self.ui.colors.accent}Popular regions:{Color.RESET}\n")
         
         for i, region in enumerate(available_popular[:4]):
-            print(f"  {self.ui.colors.menu_item}{i+1}. {region}{Color.RESET}")
+            self.ui.terminal.write(f"  {self.ui.colors.menu_item}{i+1}. {region}{Color.RESET}\n")
         
-        print(f"\n{self.ui.colors.accent}Enter choice (1-{len(available_popular)}), or 'q' to quit: {Color.RESET}", end="")
+        self.ui.terminal.write(f"\n{self.ui.colors.accent}Enter choice (1-{len(available_popular)}), or 'q' to quit: {Color.RESET}")
         
         while True:
             key = self.ui.terminal.get_key()
@@ -173,14 +205,14 @@ class AWSCleanupApp:
                 choice = int(key) - 1
                 if 0 <= choice < len(available_popular):
                     selected_region = available_popular[choice]
-                    print(f"\n{self.ui.colors.success}Selected: {selected_region}{Color.RESET}")
+                    self.ui.terminal.write(f"\n{self.ui.colors.success}Selected: {selected_region}{Color.RESET}\n")
                     return selected_region
                 else:
-                    print(f"\n{self.ui.colors.error}Invalid choice. Enter 1-{len(available_popular)}: {Color.RESET}", end="")
+                    self.ui.terminal.write(f"\n{self.ui.colors.error}Invalid choice. Enter 1-{len(available_popular)}: {Color.RESET}")
             elif key.lower() == 'q' or key == 'ESCAPE' or key == 'CTRL_C':
                 sys.exit(0)
             else:
-                print(f"\n{self.ui.colors.error}Invalid input. Enter 1-{len(available_popular)} or 'q': {Color.RESET}", end="")
+                self.ui.terminal.write(f"\n{self.ui.colors.error}Invalid input. Enter 1-{len(available_popular)} or 'q': {Color.RESET}")
     
     def _main_loop(self) -> None:
         """Main application loop."""
@@ -247,6 +279,8 @@ class AWSCleanupApp:
         """Discover AWS resources."""
         try:
             self.ui.show_message("Discovering AWS resources...", "info", 1.0)
+            # An explicit rescan should see the account as it is now
+            BaseAWSService.clear_discovery_cache()
             resources = self.discovery.discover_all_resources(self.session)
             
             # Add billing information to all resources
@@ -349,7 +383,7 @@ class AWSCleanupApp:
         for i, msg in enumerate(messages):
             if i < self.ui.terminal.height - 6:
                 self.ui.terminal.move_cursor(5, 4 + i)
-                print(f"{self.ui.colors.info}{msg}{Color.RESET}")
+                self.ui.terminal.write(f"{self.ui.colors.info}{msg}{Color.RESET}")
         
         self.ui.terminal.get_key()
     
@@ -365,18 +399,28 @@ class AWSCleanupApp:
             self.ui.show_message("Deletion cancelled.", "info", 2.0)
             return
         
-        # Calculate deletion order
-        deletion_order = self.discovery.get_deletion_order(selected)
+        # Resources within a dependency tier can go in any order, so each tier's
+        # resources of the same service, region and type are deleted in one batch
+        batch_key = attrgetter('service', 'region', 'resource_type')
+        batches = [list(group)
+                   for tier in self.discovery.get_deletion_tiers(selected)
+                   for _, group in groupby(sorted(tier, key=batch_key), key=batch_key)]
         
         # Perform deletion with progress
-        def delete_callback(resource: AWSResource) -> bool:
+        def delete_callback(batch: List[AWSResource]) -> Dict[str, bool]:
+            first = batch[0]
             try:
-                service = ServiceFactory.create_service(resource.service, self.discovery.aws_cmd_base)
-                return service.delete_resource(resource)
+                service = ServiceFactory.create_service(first.service, self.discovery.aws_cmd_base)
+                try:
+                    return service.delete_resources(batch)
+                finally:
+                    # Don't let cached describes resurrect deleted resources, even after a failure
+                    service.invalidate(first.region)
             except Exception:
-                return False
+                logger.exception("Error deleting %s/%s resources in %s", first.service, first.resource_type, first.region)
+                return {}
         
-        self.ui.show_deletion_progress(deletion_order, delete_callback)
+        self.ui.show_deletion_progress(batches, delete_callback)
         
         # Clear selections after deletion
         self.session.selected_resources.clear()
@@ -5,7 +5,8 @@ Resource discovery coordination and dependency mapping.
 import subprocess
 import json
 import os
-from typing import List, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Tuple
 from collections import defaultdict
 from .models import AWSResource, CleanupSession
 from .profile_manager import AWSProfileManager
@@ -59,24 +60,23 @@ class ResourceDiscovery:
         regions = self.get_available_regions()
         print(f"🌍 Scanning {len(regions)} regions...")
         
-        # Discover resources for each enabled service
-        for service_name in enabled_services:
-            try:
-                service = ServiceFactory.create_service(service_name, self.aws_cmd_base)
-                
-                if service.is_global_service():
-                    print(f"  🌐 {service_name.upper()}: Global service...")
-                    resources = service.discover_resources()
-                    all_resources.extend(resources)
-                else:
-                    print(f"  📍 {service_name.upper()}: Regional service...")
-                    for region in regions:
-                        print(f"    🔍 {region}")
-                        resources = service.discover_resources(region)
+        # Services are independent, so sweep them all at once and report in order
+        with ThreadPoolExecutor(max_workers=len(enabled_services)) as executor:
+            futures = [executor.submit(self._discover_service, service_name, regions)
+                       for service_name in enabled_services]
+            for service_name, future in zip(enabled_services, futures):
+                try:
+                    is_global, region_results = future.result()
+                    if is_global:
+                        print(f"  🌐 {service_name.upper()}: Global service...")
+                    else:
+                        print(f"  📍 {service_name.upper()}: Regional service...")
+                    for region, resources in region_results:
+                        if region:
+                            print(f"    🔍 {region}")
                         all_resources.extend(resources)
-                        
-            except Exception as e:
-                print(f"❌ Error discovering {service_name} resources: {e}")
+                except Exception as e:
+                    print(f"❌ Error discovering {service_name} resources: {e}")
         
         # Build dependency relationships
         self._build_dependency_map(all_resources)
@@ -87,6 +87,18 @@ class ResourceDiscovery:
         print(f"✅ Found {len(all_resources)} resources")
         return all_resources
     
+    def _discover_service(self, service_name: str, regions: List[str]) -> Tuple[bool, List[Tuple[str, List[AWSResource]]]]:
+        """Discover one service's resources, returning (is_global, [(region, resources), ...])."""
+        service = ServiceFactory.create_service(service_name, self.aws_cmd_base)
+        
+        if service.is_global_service():
+            return True, [(None, service.discover_resources())]
+        
+        # Regions are independent, so scan them concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(regions))) as executor:
+            futures = [executor.submit(service.discover_resources, region) for region in regions]
+            return False, [(region, future.result()) for region, future in zip(regions, futures)]
+    
     def _build_dependency_map(self, resources: List[AWSResource]) -> None:
         """Build bidirectional dependency relationships."""
         # Create resource lookup map
@@ -104,7 +116,11 @@ class ResourceDiscovery:
     
     def get_deletion_order(self, selected_resources: List[AWSResource]) -> List[AWSResource]:
         """Calculate safe deletion order respecting dependencies."""
-        deletion_order = []
+        return [resource for tier in self.get_deletion_tiers(selected_resources) for resource in tier]
+    
+    def get_deletion_tiers(self, selected_resources: List[AWSResource]) -> List[List[AWSResource]]:
+        """Group resources into tiers to delete in turn; nothing in a tier depends on another."""
+        tiers = []
         remaining = selected_resources.copy()
         remaining_ids = {r.identifier for r in remaining}
         
@@ -123,10 +139,10 @@ class ResourceDiscovery:
                 can_delete = [remaining[0]]
                 print("⚠️  Warning: Potential circular dependency detected")
             
-            # Add to deletion order and remove from remaining
-            deletion_order.extend(can_delete)
+            # Add as the next tier and remove from remaining
+            tiers.append(can_delete)
             for resource in can_delete:
                 remaining.remove(resource)
                 remaining_ids.remove(resource.identifier)
         
-        return deletion_order
\ No newline at end of file
+        return tiers
\ No newline at end of file
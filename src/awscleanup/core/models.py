@@ -2,11 +2,24 @@
 Core data models for AWS resource management.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Set, Optional
 from enum import Enum
 
 
+def _add_slots(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)."""
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__; class attributes would clash with slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 class EnvironmentType(Enum):
     """Environment classification."""
     PRODUCTION = "production"
@@ -29,6 +42,7 @@ class ResourceState(Enum):
     UNKNOWN = "unknown"
 
 
+@_add_slots
 @dataclass
 class BillingInfo:
     """Billing information for AWS resources."""
@@ -51,6 +65,7 @@ class BillingInfo:
         return f"${self.estimated_monthly_cost:.2f}/month"
 
 
+@_add_slots
 @dataclass
 class AWSResource:
     """Represents an AWS resource with dependencies."""
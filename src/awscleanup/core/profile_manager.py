@@ -179,6 +179,9 @@ class AWSProfileManager:
             # Remove AWS_PROFILE if using default profile
             del os.environ['AWS_PROFILE']
         
+        # Let the CLI itself rate-limit client-side when throttled, unless the user chose a mode
+        os.environ.setdefault('AWS_RETRY_MODE', 'adaptive')
+        
         # Use simple aws command without --profile flag since we use env var
         base_cmd = ['aws']
         self.aws_cmd_base = base_cmd  # Store the command base
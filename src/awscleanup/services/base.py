@@ -3,17 +3,40 @@ Base classes for AWS service discovery and management.
 """
 
 import json
+import logging
 import os
+import random
 import subprocess
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Tuple
 from ..core.models import AWSResource, ResourceState
 from ..core.exceptions import ResourceDiscoveryError, ResourceDeletionError
 
 
+logger = logging.getLogger(__name__)
+
+# Error codes AWS returns when a caller is being rate limited
+THROTTLE_ERROR_CODES = (
+    'Throttling', 'ThrottlingException', 'RequestLimitExceeded',
+    'TooManyRequestsException', 'RequestThrottled', 'SlowDown',
+)
+MAX_THROTTLE_ATTEMPTS = 5
+
+
 class BaseAWSService(ABC):
     """Base class for AWS service handlers."""
     
+    # Shared pool for independent describe calls (I/O-bound AWS CLI subprocesses)
+    _executor = ThreadPoolExecutor(max_workers=16)
+    
+    # Recent describe results shared by all service instances:
+    # (profile, service, helper, region) -> (timestamp, resources)
+    _discovery_cache: Dict[tuple, tuple] = {}
+    DISCOVERY_CACHE_TTL = 120
+    
     def __init__(self, aws_cmd_base: List[str]):
         self.aws_cmd_base = aws_cmd_base
         self.service_name = self.get_service_name()
@@ -33,6 +56,19 @@ class BaseAWSService(ABC):
         """Delete a specific resource."""
         pass
     
+    def delete_resources(self, resources: List[AWSResource]) -> Dict[str, bool]:
+        """Delete several resources of this service concurrently. Returns success by identifier."""
+        futures = [(r.identifier, self._executor.submit(self.delete_resource, r)) for r in resources]
+        results = {}
+        for identifier, future in futures:
+            try:
+                results[identifier] = future.result()
+            except Exception:
+                # One resource failing must not hide the results of the others
+                logger.exception("Error deleting %s", identifier)
+                results[identifier] = False
+        return results
+    
     def is_global_service(self) -> bool:
         """Check if this is a global service (not region-specific)."""
         return False
@@ -41,17 +77,52 @@ class BaseAWSService(ABC):
         """Get list of regions where this service is available."""
         return []  # Empty means all regions
     
-    def _run_aws_command(self, cmd_args: List[str]) -> Dict[str, Any]:
+    def _discover_concurrently(self, discover_fns: List[Callable[[str], List[AWSResource]]],
+                               region: str) -> List[AWSResource]:
+        """Run independent discovery helpers for a region concurrently."""
+        futures = [self._executor.submit(self._discover_cached, fn, region) for fn in discover_fns]
+        resources = []
+        for future in futures:
+            resources.extend(future.result())
+        return resources
+    
+    def _discover_cached(self, discover_fn: Callable[[str], List[AWSResource]],
+                         region: str) -> List[AWSResource]:
+        """Run a discovery helper, reusing a successful result for a short TTL."""
+        key = (os.environ.get('AWS_PROFILE'), self.service_name, discover_fn.__name__, region)
+        entry = self._discovery_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.DISCOVERY_CACHE_TTL:
+            return list(entry[1])
+        
+        try:
+            resources = discover_fn(region)
+        except Exception:
+            # The helper has logged it. A failed describe is not remembered as an empty
+            # region, so the next scan asks again instead of hiding live resources.
+            return []
+        self._discovery_cache[key] = (time.monotonic(), resources)
+        return list(resources)
+    
+    @classmethod
+    def clear_discovery_cache(cls) -> None:
+        """Forget all cached discovery results, e.g. when the user asks for a fresh scan."""
+        cls._discovery_cache.clear()
+    
+    def invalidate(self, region: str) -> None:
+        """Drop cached discovery results for this service in a region."""
+        for key in list(self._discovery_cache):
+            if key[1] == self.service_name and key[3] == region:
+                self._discovery_cache.pop(key, None)
+    
+    def _run_aws_command(self, cmd_args: List[str], max_attempts: int = MAX_THROTTLE_ATTEMPTS) -> Dict[str, Any]:
         """Run an AWS CLI command and return parsed JSON result."""
         cmd = self.aws_cmd_base + cmd_args
         
-        # Create environment with AWS_PROFILE explicitly set
-        env = os.environ.copy()
-        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env)
+            result = self._run_with_throttle_retry(cmd, max_attempts)
             return json.loads(result.stdout) if result.stdout.strip() else {}
         except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode(errors='replace') if e.stderr else str(e)
             if e.returncode == 253:
                 raise ResourceDiscoveryError(
                     f"AWS credentials not found. Please configure AWS credentials or specify a valid profile. "
@@ -60,10 +131,9 @@ class BaseAWSService(ABC):
             elif e.returncode == 254:
                 raise ResourceDiscoveryError(
                     f"AWS access denied. Check your AWS permissions for the current profile. "
-                    f"Error: {e.stderr or 'Permission denied'}"
+                    f"Error: {error_msg if e.stderr else 'Permission denied'}"
                 )
             else:
-                error_msg = e.stderr.decode() if hasattr(e.stderr, 'decode') else str(e.stderr or e)
                 if "UnauthorizedOperation" in error_msg or "AccessDenied" in error_msg:
                     raise ResourceDiscoveryError(
                         f"AWS access denied. The current AWS user/role does not have sufficient permissions. "
@@ -71,19 +141,44 @@ class BaseAWSService(ABC):
                     )
                 else:
                     raise ResourceDiscoveryError(f"AWS command failed (exit code {e.returncode}): {error_msg}")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise ResourceDiscoveryError(f"Failed to parse AWS response: {e}")
     
+    def _run_with_throttle_retry(self, cmd: List[str],
+                                 max_attempts: int = MAX_THROTTLE_ATTEMPTS) -> subprocess.CompletedProcess:
+        """Run an AWS CLI command, backing off and retrying when throttled."""
+        for attempt in range(max_attempts):
+            try:
+                # Child inherits os.environ (which carries AWS_PROFILE); no per-call copy needed.
+                # Output stays as bytes: json.loads decodes UTF-8 itself, which skips the
+                # text-mode newline translation over large describe responses.
+                return subprocess.run(cmd, capture_output=True, check=True)
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors='replace') if e.stderr else ''
+                throttled = any(code in stderr for code in THROTTLE_ERROR_CODES)
+                if not throttled or attempt == max_attempts - 1:
+                    raise
+                # Exponential backoff with jitter so concurrent region sweeps spread out
+                delay = min(0.1 * 2 ** attempt, 5.0) * random.uniform(0.5, 1.5)
+                logger.warning("Throttled running '%s', retrying in %.2fs (attempt %d/%d)",
+                               ' '.join(cmd[1:3]), delay, attempt + 1, max_attempts)
+                time.sleep(delay)
+    
     def _run_aws_command_simple(self, cmd_args: List[str]) -> bool:
         """Run an AWS CLI command for deletion. Returns success status."""
         cmd = self.aws_cmd_base + cmd_args
         try:
             # Use current environment which should have AWS_PROFILE set
-            subprocess.run(cmd, capture_output=True, text=True, check=True, env=os.environ)
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
             return True
         except subprocess.CalledProcessError:
             return False
     
+    @staticmethod
+    def _intern(value: Any) -> Any:
+        """Intern low-cardinality string values (types, states, engines) shared by many resources."""
+        return sys.intern(value) if isinstance(value, str) else value
+    
     def _parse_tags(self, tags: List[Dict]) -> Dict[str, str]:
         """Parse AWS tags into a simple key-value dict."""
         if not tags:
@@ -92,8 +187,19 @@ class BaseAWSService(ABC):
     
     def _get_name_from_tags(self, tags: List[Dict], fallback: str = None) -> str:
         """Extract Name tag from AWS tags list."""
-        tag_dict = self._parse_tags(tags)
-        return tag_dict.get('Name', fallback or '')
+        return self._process_tags(tags, fallback or '')[0]
+    
+    def _process_tags(self, tags: List[Dict], default_name: str = '') -> Tuple[str, Dict[str, str]]:
+        """Parse AWS tags and extract the Name tag in a single pass."""
+        tag_dict = {}
+        name = None
+        for tag in tags or ():
+            key = tag.get('Key', '')
+            value = tag.get('Value', '')
+            tag_dict[key] = value
+            if key == 'Name':
+                name = value
+        return name or default_name, tag_dict
     
     def _determine_state(self, state_info: Any) -> ResourceState:
         """Determine resource state from AWS response."""
@@ -3,24 +3,54 @@ Billing inventory service for AWS cost analysis.
 """
 
 import json
+import logging
 import os
+import statistics
 import subprocess
+import time
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from .base import BaseAWSService
+from .ec2_service import INSTANCE_HOURLY_COSTS, DEFAULT_INSTANCE_HOURLY_COST, MONTHLY_HOURS
+from .rds_service import DB_INSTANCE_HOURLY_COSTS
 from ..core.models import AWSResource, BillingInfo, ResourceState
 from ..core.exceptions import ResourceDiscoveryError
 
 
+logger = logging.getLogger(__name__)
+
+
 class BillingService:
     """Service for billing analysis and cost estimation."""
     
+    # Cost Explorer is billed per request, so responses are kept for an hour
+    CACHE_TTL_SECONDS = 3600
+    
     def __init__(self, aws_cmd_base: List[str]):
         self.aws_cmd_base = aws_cmd_base
         self.pricing_cache = {}
     
+    def _get_cached(self, key: Tuple):
+        """Get a cached Cost Explorer response if it has not expired."""
+        entry = self.pricing_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+    
+    def _set_cached(self, key: Tuple, value) -> None:
+        """Store a Cost Explorer response in the cache."""
+        self.pricing_cache[key] = (time.monotonic(), value)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached Cost Explorer responses."""
+        self.pricing_cache.clear()
+    
     def get_cost_and_usage_data(self, days: int = 30) -> Dict:
         """Get Cost and Usage data for the specified period."""
+        cached = self._get_cached(('cost_and_usage', days))
+        if cached is not None:
+            return cached
+        
         try:
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days)
@@ -35,13 +65,19 @@ class BillingService:
             ]
             
             result = self._run_aws_command(cmd)
-            return result.get('ResultsByTime', [])
+            results = result.get('ResultsByTime', [])
+            self._set_cached(('cost_and_usage', days), results)
+            return results
         except Exception as e:
-            print(f"Warning: Could not fetch cost data: {e}")
+            logger.warning("Could not fetch cost data: %s", e)
             return []
     
     def get_billing_summary(self) -> Dict:
         """Get overall billing summary."""
+        cached = self._get_cached(('billing_summary',))
+        if cached is not None:
+            return cached
+        
         try:
             # Get current month costs
             now = datetime.now()
@@ -76,10 +112,11 @@ class BillingService:
                     days_in_current_month = (now.replace(month=now.month+1, day=1) - timedelta(days=1)).day
                     summary['forecast_monthly_cost'] = daily_avg * days_in_current_month
             
+            self._set_cached(('billing_summary',), summary)
             return summary
             
         except Exception as e:
-            print(f"Warning: Could not fetch billing summary: {e}")
+            logger.warning("Could not fetch billing summary: %s", e)
             return {'current_month_cost': 0.0, 'forecast_monthly_cost': 0.0, 'top_services': [], 'cost_trend': 'unknown'}
     
     def estimate_resource_cost(self, resource: AWSResource) -> Optional[BillingInfo]:
@@ -108,20 +145,11 @@ class BillingService:
         instance_type = resource.metadata.get('instance_type', 't3.micro')
         state = resource.metadata.get('state', {})
         
-        # Basic cost estimates (simplified)
-        cost_per_hour = {
-            't3.micro': 0.0104, 't3.small': 0.0208, 't3.medium': 0.0416,
-            't3.large': 0.0832, 't3.xlarge': 0.1664, 't3.2xlarge': 0.3328,
-            'm5.large': 0.096, 'm5.xlarge': 0.192, 'm5.2xlarge': 0.384,
-            'c5.large': 0.085, 'c5.xlarge': 0.17, 'c5.2xlarge': 0.34,
-            'r5.large': 0.126, 'r5.xlarge': 0.252, 'r5.2xlarge': 0.504
-        }
-        
-        hourly_cost = cost_per_hour.get(instance_type, 0.05)  # default fallback
+        hourly_cost = INSTANCE_HOURLY_COSTS.get(instance_type, DEFAULT_INSTANCE_HOURLY_COST)
         
         # Calculate monthly cost (24 hours * 30 days)
         if resource.state == ResourceState.RUNNING:
-            monthly_cost = hourly_cost * 24 * 30
+            monthly_cost = hourly_cost * MONTHLY_HOURS
         else:
             monthly_cost = 0.0  # stopped instances don't incur compute costs
         
@@ -168,16 +196,8 @@ class BillingService:
         """Estimate RDS instance cost."""
         instance_class = resource.metadata.get('instance_class', 'db.t3.micro')
         
-        # RDS cost estimates (simplified)
-        cost_per_hour = {
-            'db.t3.micro': 0.017, 'db.t3.small': 0.034, 'db.t3.medium': 0.068,
-            'db.t3.large': 0.136, 'db.t3.xlarge': 0.272,
-            'db.m5.large': 0.192, 'db.m5.xlarge': 0.384,
-            'db.r5.large': 0.24, 'db.r5.xlarge': 0.48
-        }
-        
-        hourly_cost = cost_per_hour.get(instance_class, 0.02)
-        monthly_cost = hourly_cost * 24 * 30
+        hourly_cost = DB_INSTANCE_HOURLY_COSTS.get(instance_class, 0.02)
+        monthly_cost = hourly_cost * MONTHLY_HOURS
         
         # Add storage cost
         storage_cost = 20 * 0.115  # 20GB GP2 storage estimate
@@ -242,28 +262,30 @@ class BillingService:
     
     def generate_billing_report(self, resources: List[AWSResource]) -> Dict:
         """Generate comprehensive billing report."""
-        billing_resources = [r for r in resources if r.generates_cost]
-        
-        total_estimated_cost = sum(r.estimated_monthly_cost for r in billing_resources)
-        
-        # Group by service
+        billing_resources = []
+        total_estimated_cost = 0.0
         by_service = {}
-        for resource in billing_resources:
-            service = resource.service
-            if service not in by_service:
-                by_service[service] = {'count': 0, 'cost': 0.0, 'resources': []}
-            by_service[service]['count'] += 1
-            by_service[service]['cost'] += resource.estimated_monthly_cost
-            by_service[service]['resources'].append(resource)
-        
-        # Group by cost categories
         by_category = {}
-        for resource in billing_resources:
-            if resource.billing_info:
-                for category in resource.billing_info.cost_categories:
-                    if category not in by_category:
-                        by_category[category] = 0.0
-                    by_category[category] += resource.estimated_monthly_cost
+        
+        # Single pass: filter billable resources and group by service and cost category
+        for resource in resources:
+            billing_info = resource.billing_info
+            if billing_info is None:
+                continue
+            
+            cost = resource.estimated_monthly_cost
+            billing_resources.append(resource)
+            total_estimated_cost += cost
+            
+            service_data = by_service.get(resource.service)
+            if service_data is None:
+                service_data = by_service[resource.service] = {'count': 0, 'cost': 0.0, 'resources': []}
+            service_data['count'] += 1
+            service_data['cost'] += cost
+            service_data['resources'].append(resource)
+            
+            for category in billing_info.cost_categories:
+                by_category[category] = by_category.get(category, 0.0) + cost
         
         # Top cost resources
         top_resources = sorted(
@@ -284,18 +306,18 @@ class BillingService:
     
     def _calculate_cost_distribution(self, resources: List[AWSResource]) -> Dict:
         """Calculate cost distribution statistics."""
-        costs = [r.estimated_monthly_cost for r in resources if r.estimated_monthly_cost > 0]
+        # Read each cost once; the property re-checks billing_info on every access
+        costs = [cost for cost in (r.estimated_monthly_cost for r in resources) if cost > 0]
         
         if not costs:
             return {'min': 0, 'max': 0, 'avg': 0, 'median': 0}
         
-        costs.sort()
         n = len(costs)
         
         return {
-            'min': costs[0],
-            'max': costs[-1],
+            'min': min(costs),
+            'max': max(costs),
             'avg': sum(costs) / n,
-            'median': costs[n // 2] if n % 2 == 1 else (costs[n // 2 - 1] + costs[n // 2]) / 2,
+            'median': statistics.median(costs),
             'total_resources_with_cost': n
         }
\ No newline at end of file
@@ -2,11 +2,15 @@
 CloudWatch service discovery for monitoring resources that generate costs.
 """
 
+import logging
 from typing import List
 from .base import BaseAWSService
 from ..core.models import AWSResource, ResourceState, BillingInfo
 
 
+logger = logging.getLogger(__name__)
+
+
 class CloudWatchService(BaseAWSService):
     """Handles CloudWatch logs, metrics, and dashboards."""
     
@@ -15,11 +19,25 @@ class CloudWatchService(BaseAWSService):
     
     def discover_resources(self, region: str) -> List[AWSResource]:
         """Discover CloudWatch resources."""
-        resources = []
-        resources.extend(self._discover_log_groups(region))
-        resources.extend(self._discover_dashboards(region))
-        resources.extend(self._discover_alarms(region))
-        return resources
+        return self._discover_concurrently([
+            self._discover_log_groups,
+            self._discover_dashboards,
+            self._discover_alarms,
+        ], region)
+    
+    def _make_cw_resource(self, resource_type: str, identifier: str, region: str,
+                          metadata: dict, billing_info: BillingInfo) -> AWSResource:
+        """Build a CloudWatch resource; all of them are named by their identifier."""
+        return AWSResource(
+            service='cloudwatch',
+            resource_type=resource_type,
+            identifier=identifier,
+            name=identifier,
+            region=region,
+            metadata=metadata,
+            state=ResourceState.AVAILABLE,
+            billing_info=billing_info
+        )
     
     def _discover_log_groups(self, region: str) -> List[AWSResource]:
         """Discover CloudWatch Log Groups."""
@@ -53,23 +71,19 @@ class CloudWatchService(BaseAWSService):
                     cost_categories=["monitoring", "storage"]
                 )
                 
-                resources.append(AWSResource(
-                    service='cloudwatch',
-                    resource_type='log_group',
-                    identifier=log_group_name,
-                    name=log_group_name,
-                    region=region,
-                    metadata={
+                resources.append(self._make_cw_resource(
+                    'log_group', log_group_name, region,
+                    {
                         'stored_bytes': stored_bytes,
                         'retention_days': retention_days,
                         'creation_time': log_group.get('creationTime', 0),
                         'metric_filter_count': log_group.get('metricFilterCount', 0)
                     },
-                    state=ResourceState.AVAILABLE,
-                    billing_info=billing_info
+                    billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering CloudWatch Log Groups in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering CloudWatch Log Groups in %s", region)
+            raise
         
         return resources
     
@@ -97,21 +111,17 @@ class CloudWatchService(BaseAWSService):
                     cost_categories=["monitoring", "visualization"]
                 )
                 
-                resources.append(AWSResource(
-                    service='cloudwatch',
-                    resource_type='dashboard',
-                    identifier=dashboard_name,
-                    name=dashboard_name,
-                    region=region,
-                    metadata={
+                resources.append(self._make_cw_resource(
+                    'dashboard', dashboard_name, region,
+                    {
                         'last_modified': dashboard.get('LastModified', ''),
                         'size': dashboard.get('Size', 0)
                     },
-                    state=ResourceState.AVAILABLE,
-                    billing_info=billing_info
+                    billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering CloudWatch Dashboards in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering CloudWatch Dashboards in %s", region)
+            raise
         
         return resources
     
@@ -123,10 +133,17 @@ class CloudWatchService(BaseAWSService):
                 'cloudwatch', 'describe-alarms',
                 '--region', region,
                 '--max-records', '100',
+                # Only project the fields we use; alarm actions and dimensions bloat the payload
+                '--query', 'MetricAlarms[].{AlarmName: AlarmName, StateValue: StateValue, '
+                           'MetricName: MetricName, Namespace: Namespace, '
+                           'ComparisonOperator: ComparisonOperator, Threshold: Threshold, '
+                           'ActionsEnabled: ActionsEnabled}',
                 '--output', 'json'
             ])
             
-            for alarm in response.get('MetricAlarms', []):
+            for alarm in response or []:
+                # Projected fields are null rather than absent when missing
+                alarm = {key: value for key, value in alarm.items() if value is not None}
                 alarm_name = alarm.get('AlarmName', '')
                 alarm_state = alarm.get('StateValue', 'UNKNOWN')
                 
@@ -143,13 +160,9 @@ class CloudWatchService(BaseAWSService):
                     cost_categories=["monitoring", "alerting"]
                 )
                 
-                resources.append(AWSResource(
-                    service='cloudwatch',
-                    resource_type='alarm',
-                    identifier=alarm_name,
-                    name=alarm_name,
-                    region=region,
-                    metadata={
+                resources.append(self._make_cw_resource(
+                    'alarm', alarm_name, region,
+                    {
                         'state': alarm_state,
                         'metric_name': alarm.get('MetricName', ''),
                         'namespace': alarm.get('Namespace', ''),
@@ -157,11 +170,11 @@ class CloudWatchService(BaseAWSService):
                         'threshold': alarm.get('Threshold', 0),
                         'actions_enabled': alarm.get('ActionsEnabled', False)
                     },
-                    state=ResourceState.AVAILABLE,
-                    billing_info=billing_info
+                    billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering CloudWatch Alarms in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering CloudWatch Alarms in %s", region)
+            raise
         
         return resources
     
@@ -188,6 +201,6 @@ class CloudWatchService(BaseAWSService):
                 ])
             else:
                 return False
-        except Exception as e:
-            print(f"Error deleting CloudWatch resource {resource.name}: {e}")
+        except Exception:
+            logger.exception("Error deleting CloudWatch resource %s", resource.name)
             return False
\ No newline at end of file
@@ -2,11 +2,45 @@
 Elastic Load Balancer service discovery and management.
 """
 
+import dataclasses
+import logging
 from typing import List
 from .base import BaseAWSService
 from ..core.models import AWSResource, ResourceState, BillingInfo
 
 
+logger = logging.getLogger(__name__)
+
+# Load balancer pricing is flat per type; only usage_metrics vary per resource.
+# The templates' cost_categories lists are shared by every copy and must not be mutated.
+CLB_BILLING_TEMPLATE = BillingInfo(
+    estimated_monthly_cost=18.0,  # ~$0.025/hour * 24 * 30
+    pricing_model="hourly",
+    billing_unit="hours",
+    cost_categories=["load-balancing", "network"]
+)
+
+# ALB pricing includes Load Balancer Capacity Units (LCUs)
+ALB_BILLING_TEMPLATE = BillingInfo(
+    estimated_monthly_cost=22.5,  # Base $16.2/month + LCU costs
+    pricing_model="hourly + LCU",
+    billing_unit="hours + LCUs",
+    cost_categories=["load-balancing", "network"]
+)
+
+NLB_BILLING_TEMPLATE = BillingInfo(
+    estimated_monthly_cost=16.2,  # $0.0225/hour * 24 * 30
+    pricing_model="hourly + NLCU",
+    billing_unit="hours + NLCUs",
+    cost_categories=["load-balancing", "network"]
+)
+
+V2_BILLING_TEMPLATES = {
+    'application': ALB_BILLING_TEMPLATE,
+    'network': NLB_BILLING_TEMPLATE,
+}
+
+
 class ELBService(BaseAWSService):
     """Handles Classic Load Balancers, ALBs, and NLBs."""
     
@@ -15,11 +49,10 @@ class ELBService(BaseAWSService):
     
     def discover_resources(self, region: str) -> List[AWSResource]:
         """Discover all types of load balancers."""
-        resources = []
-        resources.extend(self._discover_classic_load_balancers(region))
-        resources.extend(self._discover_application_load_balancers(region))
-        resources.extend(self._discover_network_load_balancers(region))
-        return resources
+        return self._discover_concurrently([
+            self._discover_classic_load_balancers,
+            self._discover_v2_load_balancers,
+        ], region)
     
     def _discover_classic_load_balancers(self, region: str) -> List[AWSResource]:
         """Discover Classic Load Balancers (ELB v1)."""
@@ -34,20 +67,13 @@ class ELBService(BaseAWSService):
             for lb in response.get('LoadBalancerDescriptions', []):
                 lb_name = lb.get('LoadBalancerName', '')
                 vpc_id = lb.get('VPCId')
-                scheme = lb.get('Scheme', 'internet-facing')
+                scheme = self._intern(lb.get('Scheme', 'internet-facing'))
                 
-                # Estimate cost for Classic Load Balancer
-                billing_info = BillingInfo(
-                    estimated_monthly_cost=18.0,  # ~$0.025/hour * 24 * 30
-                    pricing_model="hourly",
-                    billing_unit="hours",
-                    usage_metrics={
-                        'scheme': scheme,
-                        'instances': len(lb.get('Instances', [])),
-                        'type': 'classic'
-                    },
-                    cost_categories=["load-balancing", "network"]
-                )
+                billing_info = dataclasses.replace(CLB_BILLING_TEMPLATE, usage_metrics={
+                    'scheme': scheme,
+                    'instances': len(lb.get('Instances', [])),
+                    'type': 'classic'
+                })
                 
                 resources.append(AWSResource(
                     service='elb',
@@ -65,114 +91,63 @@ class ELBService(BaseAWSService):
                     state=ResourceState.AVAILABLE,
                     billing_info=billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering Classic Load Balancers in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering Classic Load Balancers in %s", region)
+            raise
         
         return resources
     
-    def _discover_application_load_balancers(self, region: str) -> List[AWSResource]:
-        """Discover Application Load Balancers (ALB)."""
+    def _discover_v2_load_balancers(self, region: str) -> List[AWSResource]:
+        """Discover Application and Network Load Balancers (ELB v2) with one describe call."""
         resources = []
         try:
             response = self._run_aws_command([
                 'elbv2', 'describe-load-balancers',
                 '--region', region,
-                '--query', 'LoadBalancers[?Type==`application`]',
                 '--output', 'json'
             ])
             
-            for lb in response:
-                lb_name = lb.get('LoadBalancerName', '')
-                lb_arn = lb.get('LoadBalancerArn', '')
-                vpc_id = lb.get('VpcId')
-                scheme = lb.get('Scheme', 'internet-facing')
-                
-                # ALB pricing includes Load Balancer Capacity Units (LCUs)
-                billing_info = BillingInfo(
-                    estimated_monthly_cost=22.5,  # Base $16.2/month + LCU costs
-                    pricing_model="hourly + LCU",
-                    billing_unit="hours + LCUs",
-                    usage_metrics={
-                        'scheme': scheme,
-                        'type': 'application',
-                        'ip_address_type': lb.get('IpAddressType', 'ipv4')
-                    },
-                    cost_categories=["load-balancing", "network"]
-                )
-                
-                resources.append(AWSResource(
-                    service='elb',
-                    resource_type='application-load-balancer',
-                    identifier=lb_arn,
-                    name=lb_name,
-                    region=region,
-                    dependencies=[vpc_id] if vpc_id else [],
-                    metadata={
-                        'scheme': scheme,
-                        'dns_name': lb.get('DNSName', ''),
-                        'state': lb.get('State', {}).get('Code', 'unknown'),
-                        'type': lb.get('Type', 'application'),
-                        'availability_zones': lb.get('AvailabilityZones', [])
-                    },
-                    state=self._determine_state(lb.get('State', {}).get('Code')),
-                    billing_info=billing_info
-                ))
-        except Exception as e:
-            print(f"Error discovering Application Load Balancers in {region}: {e}")
+            # Gateway load balancers are not handled
+            resources.extend(self._build_v2_load_balancer(lb, region)
+                             for lb in response.get('LoadBalancers', [])
+                             if lb.get('Type') in V2_BILLING_TEMPLATES)
+        except Exception:
+            logger.exception("Error discovering Application/Network Load Balancers in %s", region)
+            raise
         
         return resources
     
-    def _discover_network_load_balancers(self, region: str) -> List[AWSResource]:
-        """Discover Network Load Balancers (NLB)."""
-        resources = []
-        try:
-            response = self._run_aws_command([
-                'elbv2', 'describe-load-balancers',
-                '--region', region,
-                '--query', 'LoadBalancers[?Type==`network`]',
-                '--output', 'json'
-            ])
-            
-            for lb in response:
-                lb_name = lb.get('LoadBalancerName', '')
-                lb_arn = lb.get('LoadBalancerArn', '')
-                vpc_id = lb.get('VpcId')
-                scheme = lb.get('Scheme', 'internet-facing')
-                
-                # NLB pricing
-                billing_info = BillingInfo(
-                    estimated_monthly_cost=16.2,  # $0.0225/hour * 24 * 30
-                    pricing_model="hourly + NLCU",
-                    billing_unit="hours + NLCUs",
-                    usage_metrics={
-                        'scheme': scheme,
-                        'type': 'network',
-                        'ip_address_type': lb.get('IpAddressType', 'ipv4')
-                    },
-                    cost_categories=["load-balancing", "network"]
-                )
-                
-                resources.append(AWSResource(
-                    service='elb',
-                    resource_type='network-load-balancer',
-                    identifier=lb_arn,
-                    name=lb_name,
-                    region=region,
-                    dependencies=[vpc_id] if vpc_id else [],
-                    metadata={
-                        'scheme': scheme,
-                        'dns_name': lb.get('DNSName', ''),
-                        'state': lb.get('State', {}).get('Code', 'unknown'),
-                        'type': lb.get('Type', 'network'),
-                        'availability_zones': lb.get('AvailabilityZones', [])
-                    },
-                    state=self._determine_state(lb.get('State', {}).get('Code')),
-                    billing_info=billing_info
-                ))
-        except Exception as e:
-            print(f"Error discovering Network Load Balancers in {region}: {e}")
+    def _build_v2_load_balancer(self, lb: dict, region: str) -> AWSResource:
+        """Build an Application (ALB) or Network (NLB) Load Balancer resource."""
+        lb_type = lb['Type']
+        lb_name = lb.get('LoadBalancerName', '')
+        lb_arn = lb.get('LoadBalancerArn', '')
+        vpc_id = lb.get('VpcId')
+        scheme = self._intern(lb.get('Scheme', 'internet-facing'))
         
-        return resources
+        billing_info = dataclasses.replace(V2_BILLING_TEMPLATES[lb_type], usage_metrics={
+            'scheme': scheme,
+            'type': lb_type,
+            'ip_address_type': lb.get('IpAddressType', 'ipv4')
+        })
+        
+        return AWSResource(
+            service='elb',
+            resource_type=f'{lb_type}-load-balancer',
+            identifier=lb_arn,
+            name=lb_name,
+            region=region,
+            dependencies=[vpc_id] if vpc_id else [],
+            metadata={
+                'scheme': scheme,
+                'dns_name': lb.get('DNSName', ''),
+                'state': lb.get('State', {}).get('Code', 'unknown'),
+                'type': lb_type,
+                'availability_zones': lb.get('AvailabilityZones', [])
+            },
+            state=self._determine_state(lb.get('State', {}).get('Code')),
+            billing_info=billing_info
+        )
     
     def delete_resource(self, resource: AWSResource) -> bool:
         """Delete a load balancer."""
@@ -189,6 +164,6 @@ class ELBService(BaseAWSService):
                     '--region', resource.region,
                     '--load-balancer-arn', resource.identifier
                 ])
-        except Exception as e:
-            print(f"Error deleting load balancer {resource.name}: {e}")
+        except Exception:
+            logger.exception("Error deleting load balancer %s", resource.name)
             return False
\ No newline at end of file
@@ -2,11 +2,47 @@
 Enhanced RDS service discovery with billing information.
 """
 
+import logging
+from types import MappingProxyType
 from typing import List
 from .base import BaseAWSService
 from ..core.models import AWSResource, ResourceState, BillingInfo
 
 
+logger = logging.getLogger(__name__)
+
+MONTHLY_HOURS = 24 * 30
+
+# RDS instance pricing (simplified estimates)
+DB_INSTANCE_HOURLY_COSTS = {
+    'db.t3.micro': 0.017, 'db.t3.small': 0.034, 'db.t3.medium': 0.068,
+    'db.t3.large': 0.136, 'db.t3.xlarge': 0.272, 'db.t3.2xlarge': 0.544,
+    'db.m5.large': 0.192, 'db.m5.xlarge': 0.384, 'db.m5.2xlarge': 0.768,
+    'db.r5.large': 0.24, 'db.r5.xlarge': 0.48, 'db.r5.2xlarge': 0.96,
+    'db.m6i.large': 0.184, 'db.m6i.xlarge': 0.368, 'db.m6i.2xlarge': 0.736
+}
+DEFAULT_DB_INSTANCE_HOURLY_COST = 0.05
+
+# Engine cost multipliers relative to open-source engines
+ENGINE_COST_MULTIPLIERS = {
+    'postgres': 1.0, 'mysql': 1.0, 'mariadb': 1.0,
+    'oracle-ee': 2.5, 'oracle-se2': 2.0, 'oracle-se1': 1.8,
+    'sqlserver-ex': 1.0, 'sqlserver-web': 1.2, 'sqlserver-se': 1.8, 'sqlserver-ee': 2.2
+}
+
+# RDS status (lowercase) to ResourceState
+RDS_STATE_MAP = MappingProxyType({
+    'available': ResourceState.AVAILABLE,
+    'stopped': ResourceState.STOPPED,
+    'starting': ResourceState.PENDING,
+    'stopping': ResourceState.PENDING,
+    'deleting': ResourceState.DELETING,
+    'creating': ResourceState.PENDING,
+    'backing-up': ResourceState.AVAILABLE,
+    'modifying': ResourceState.AVAILABLE
+})
+
+
 class RDSService(BaseAWSService):
     """Handles RDS instances, clusters, and related resources."""
     
@@ -15,11 +51,11 @@ class RDSService(BaseAWSService):
     
     def discover_resources(self, region: str) -> List[AWSResource]:
         """Discover RDS instances, clusters, and snapshots."""
-        resources = []
-        resources.extend(self._discover_db_instances(region))
-        resources.extend(self._discover_db_clusters(region))
-        resources.extend(self._discover_db_snapshots(region))
-        return resources
+        return self._discover_concurrently([
+            self._discover_db_instances,
+            self._discover_db_clusters,
+            self._discover_db_snapshots,
+        ], region)
     
     def _discover_db_instances(self, region: str) -> List[AWSResource]:
         """Discover RDS database instances."""
@@ -33,9 +69,9 @@ class RDSService(BaseAWSService):
             
             for instance in response.get('DBInstances', []):
                 db_id = instance.get('DBInstanceIdentifier', '')
-                instance_class = instance.get('DBInstanceClass', 'db.t3.micro')
-                engine = instance.get('Engine', 'unknown')
-                status = instance.get('DBInstanceStatus', 'unknown')
+                instance_class = self._intern(instance.get('DBInstanceClass', 'db.t3.micro'))
+                engine = self._intern(instance.get('Engine', 'unknown'))
+                status = self._intern(instance.get('DBInstanceStatus', 'unknown'))
                 allocated_storage = instance.get('AllocatedStorage', 20)
                 
                 # Estimate RDS instance cost
@@ -62,8 +98,9 @@ class RDSService(BaseAWSService):
                     state=self._map_rds_state(status),
                     billing_info=billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering RDS instances in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering RDS instances in %s", region)
+            raise
         
         return resources
     
@@ -79,8 +116,8 @@ class RDSService(BaseAWSService):
             
             for cluster in response.get('DBClusters', []):
                 cluster_id = cluster.get('DBClusterIdentifier', '')
-                engine = cluster.get('Engine', 'aurora')
-                status = cluster.get('Status', 'unknown')
+                engine = self._intern(cluster.get('Engine', 'aurora'))
+                status = self._intern(cluster.get('Status', 'unknown'))
                 
                 # Aurora cluster pricing varies significantly
                 billing_info = BillingInfo(
@@ -112,8 +149,9 @@ class RDSService(BaseAWSService):
                     state=self._map_rds_state(status),
                     billing_info=billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering RDS clusters in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering RDS clusters in %s", region)
+            raise
         
         return resources
     
@@ -125,14 +163,15 @@ class RDSService(BaseAWSService):
                 'rds', 'describe-db-snapshots',
                 '--region', region,
                 '--snapshot-type', 'manual',
-                '--max-items', '100',  # Limit to avoid too many results
+                # The CLI follows every page; --page-size only bounds each request
+                '--page-size', '100',
                 '--output', 'json'
             ])
             
             for snapshot in response.get('DBSnapshots', []):
                 snapshot_id = snapshot.get('DBSnapshotIdentifier', '')
                 allocated_storage = snapshot.get('AllocatedStorage', 0)
-                status = snapshot.get('Status', 'unknown')
+                status = self._intern(snapshot.get('Status', 'unknown'))
                 
                 # Snapshot storage cost
                 monthly_cost = allocated_storage * 0.095  # $0.095 per GB-month
@@ -165,36 +204,20 @@ class RDSService(BaseAWSService):
                     state=self._map_rds_state(status),
                     billing_info=billing_info
                 ))
-        except Exception as e:
-            print(f"Error discovering RDS snapshots in {region}: {e}")
+        except Exception:
+            logger.exception("Error discovering RDS snapshots in %s", region)
+            raise
         
         return resources
     
     def _estimate_rds_instance_cost(self, instance_class: str, engine: str, storage_gb: int, status: str) -> BillingInfo:
         """Estimate RDS instance cost based on class and configuration."""
-        # RDS instance pricing (simplified estimates)
-        instance_costs = {
-            'db.t3.micro': 0.017, 'db.t3.small': 0.034, 'db.t3.medium': 0.068,
-            'db.t3.large': 0.136, 'db.t3.xlarge': 0.272, 'db.t3.2xlarge': 0.544,
-            'db.m5.large': 0.192, 'db.m5.xlarge': 0.384, 'db.m5.2xlarge': 0.768,
-            'db.r5.large': 0.24, 'db.r5.xlarge': 0.48, 'db.r5.2xlarge': 0.96,
-            'db.m6i.large': 0.184, 'db.m6i.xlarge': 0.368, 'db.m6i.2xlarge': 0.736
-        }
-        
-        hourly_cost = instance_costs.get(instance_class, 0.05)
-        
-        # Engine multipliers
-        engine_multipliers = {
-            'postgres': 1.0, 'mysql': 1.0, 'mariadb': 1.0,
-            'oracle-ee': 2.5, 'oracle-se2': 2.0, 'oracle-se1': 1.8,
-            'sqlserver-ex': 1.0, 'sqlserver-web': 1.2, 'sqlserver-se': 1.8, 'sqlserver-ee': 2.2
-        }
-        
-        hourly_cost *= engine_multipliers.get(engine, 1.0)
+        hourly_cost = DB_INSTANCE_HOURLY_COSTS.get(instance_class, DEFAULT_DB_INSTANCE_HOURLY_COST)
+        hourly_cost *= ENGINE_COST_MULTIPLIERS.get(engine, 1.0)
         
         # Calculate monthly cost
         if status.lower() in ['available', 'running']:
-            compute_cost = hourly_cost * 24 * 30
+            compute_cost = hourly_cost * MONTHLY_HOURS
         else:
             compute_cost = 0.0  # stopped instances don't incur compute costs
         
@@ -220,17 +243,7 @@ class RDSService(BaseAWSService):
     
     def _map_rds_state(self, status: str) -> ResourceState:
         """Map RDS status to ResourceState."""
-        status_mapping = {
-            'available': ResourceState.AVAILABLE,
-            'stopped': ResourceState.STOPPED,
-            'starting': ResourceState.PENDING,
-            'stopping': ResourceState.PENDING,
-            'deleting': ResourceState.DELETING,
-            'creating': ResourceState.PENDING,
-            'backing-up': ResourceState.AVAILABLE,
-            'modifying': ResourceState.AVAILABLE
-        }
-        return status_mapping.get(status.lower(), ResourceState.UNKNOWN)
+        return RDS_STATE_MAP.get(status.lower() if status else '', ResourceState.UNKNOWN)
     
     def delete_resource(self, resource: AWSResource) -> bool:
         """Delete an RDS resource."""
@@ -257,6 +270,6 @@ class RDSService(BaseAWSService):
                 ])
             else:
                 return False
-        except Exception as e:
-            print(f"Error deleting RDS resource {resource.name}: {e}")
+        except Exception:
+            logger.exception("Error deleting RDS resource %s", resource.name)
             return False
\ No newline at end of file
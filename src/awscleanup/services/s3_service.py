@@ -2,14 +2,86 @@
 S3 service discovery and management.
 """
 
-from typing import List
-from .base import BaseAWSService
+import json
+import logging
+import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Dict, List, Optional
+from .base import BaseAWSService, THROTTLE_ERROR_CODES
+from ..config.settings import Settings
 from ..core.models import AWSResource, ResourceState, BillingInfo
+from ..core.exceptions import ResourceDiscoveryError
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a slow read-only metadata call is raced by a duplicate. Well above
+# normal AWS CLI start-up plus round trip, so only stalled requests get hedged.
+HEDGE_DELAY = 2.0
+
+# Duplicates allowed in flight at once. A losing attempt cannot be stopped once its
+# CLI process is running, so it holds its slot until it finishes on its own.
+MAX_OUTSTANDING_HEDGES = 8
+
+# S3 Standard pricing (simplified)
+STANDARD_GB_MONTH_COST = 0.023
+REQUEST_COST_PER_OBJECT = 0.0004 / 1000  # PUT/GET requests
+MIN_REQUEST_COST = 0.001
+ESTIMATED_GB_PER_OBJECT = 0.1  # Used only when no size metric is published
+BYTES_PER_GB = 1024 ** 3
+
+# A bucket's region never changes, so lookups are remembered across runs
+BUCKET_REGION_CACHE_FILE = Settings.config_dir / 'cleanup_bucket_regions.json'
+
+# Error codes S3 answers with when a request reaches the wrong regional endpoint
+REGION_REDIRECT_CODES = ('PermanentRedirect', '(301)')
+
+
+def _bucket_billing(object_count: int, size_bytes: Optional[int]) -> BillingInfo:
+    """Build S3 bucket billing info; each bucket gets its own, as callers may modify it."""
+    # size_bytes covers every storage class and is priced at the Standard rate;
+    # the per-object guess is only for buckets S3 has published no size for yet
+    if size_bytes is not None:
+        estimated_size_gb = max(size_bytes / BYTES_PER_GB, 1.0)
+    else:
+        estimated_size_gb = max(object_count * ESTIMATED_GB_PER_OBJECT, 1.0)
+    
+    storage_cost = estimated_size_gb * STANDARD_GB_MONTH_COST
+    request_cost = max(object_count * REQUEST_COST_PER_OBJECT, MIN_REQUEST_COST)
+    
+    monthly_cost = storage_cost + request_cost
+    
+    return BillingInfo(
+        estimated_monthly_cost=monthly_cost,
+        pricing_model="pay-per-use",
+        billing_unit="GB-month + requests",
+        usage_metrics={
+            'estimated_size_gb': estimated_size_gb,
+            'object_count': object_count,
+            'storage_class': 'STANDARD',
+            'size_source': 'metric' if size_bytes is not None else 'object count',
+            'storage_cost': storage_cost,
+            'request_cost': request_cost
+        },
+        cost_categories=["storage", "requests"]
+    )
 
 
 class S3Service(BaseAWSService):
     """Handles S3 buckets."""
     
+    # Separate from the bucket fan-out pool so hedged calls never wait on their own callers
+    _hedge_executor = ThreadPoolExecutor(max_workers=32)
+    _hedge_slots = threading.BoundedSemaphore(MAX_OUTSTANDING_HEDGES)
+    
+    # Bucket name -> region, loaded from BUCKET_REGION_CACHE_FILE on first use. Bucket
+    # lookups and deletes run on worker threads, so every access holds the lock.
+    _bucket_regions: Dict[str, str] = None
+    _bucket_regions_lock = threading.RLock()
+    
     def get_service_name(self) -> str:
         return "s3"
     
@@ -20,110 +92,261 @@ class S3Service(BaseAWSService):
         """Discover S3 buckets (global service)."""
         resources = []
         try:
+            # Output is read by key rather than through a --query projection, so the
+            # BucketRegion field newer CLIs include is available without extra calls
             response = self._run_aws_command([
                 's3api', 'list-buckets',
-                '--query', 'Buckets[].[Name,CreationDate]',
                 '--output', 'json'
             ])
             
-            for bucket_data in response:
-                bucket_name, creation_date = bucket_data
-                
-                # Get bucket location
-                try:
-                    location_response = self._run_aws_command([
-                        's3api', 'get-bucket-location',
-                        '--bucket', bucket_name,
-                        '--output', 'json'
-                    ])
-                    bucket_region = location_response.get('LocationConstraint') or 'us-east-1'
-                except Exception:
-                    bucket_region = 'unknown'
-                
-                # Get bucket size and object count (optional)
-                bucket_info = self._get_bucket_info(bucket_name)
-                
-                # Estimate S3 costs
-                billing_info = self._estimate_s3_cost(bucket_info)
-                
-                resources.append(AWSResource(
-                    service='s3',
-                    resource_type='bucket',
-                    identifier=bucket_name,
-                    name=bucket_name,
-                    region=bucket_region,
-                    metadata={
-                        'creation_date': creation_date,
-                        'region': bucket_region,
-                        **bucket_info
-                    },
-                    state=ResourceState.AVAILABLE,
-                    billing_info=billing_info
-                ))
-        except Exception as e:
-            print(f"Error discovering S3 buckets: {e}")
+            # Per-bucket lookups are independent round trips, so fan them out
+            with self._bucket_regions_lock:
+                regions_before = len(self._load_bucket_regions())
+            resources = list(self._executor.map(self._describe_bucket, response.get('Buckets', [])))
+            with self._bucket_regions_lock:
+                regions_changed = len(self._bucket_regions) != regions_before
+            if regions_changed:
+                self._save_bucket_regions()
+        except Exception:
+            logger.exception("Error discovering S3 buckets")
         
         return resources
     
-    def _get_bucket_info(self, bucket_name: str) -> dict:
-        """Get additional bucket information."""
-        info = {'objects': 0, 'size': 0}
+    @classmethod
+    def _load_bucket_regions(cls) -> Dict[str, str]:
+        """Load the persisted bucket region cache once per process."""
+        with cls._bucket_regions_lock:
+            if cls._bucket_regions is None:
+                try:
+                    with open(BUCKET_REGION_CACHE_FILE) as f:
+                        cls._bucket_regions = json.load(f)
+                except (OSError, ValueError):
+                    cls._bucket_regions = {}
+            return cls._bucket_regions
+    
+    @classmethod
+    def _forget_bucket_region(cls, bucket_name: str) -> bool:
+        """Drop a bucket's remembered region; return whether there was one."""
+        with cls._bucket_regions_lock:
+            return cls._load_bucket_regions().pop(bucket_name, None) is not None
+    
+    @classmethod
+    def _save_bucket_regions(cls) -> None:
+        """Persist the bucket region cache."""
         try:
-            # Try to get object count and size
-            response = self._run_aws_command([
-                's3api', 'list-objects-v2',
+            BUCKET_REGION_CACHE_FILE.parent.mkdir(exist_ok=True)
+            # Held across the write too, so two saves can't interleave in the file
+            with cls._bucket_regions_lock, open(BUCKET_REGION_CACHE_FILE, 'w') as f:
+                json.dump(dict(cls._load_bucket_regions()), f)
+        except OSError:
+            logger.debug("Could not save bucket region cache", exc_info=True)
+    
+    def _describe_bucket(self, bucket: dict) -> AWSResource:
+        """Build a bucket resource from its list-buckets entry."""
+        bucket_name = bucket.get('Name', '')
+        creation_date = bucket.get('CreationDate')
+        bucket_region = bucket.get('BucketRegion') or self._get_bucket_region(bucket_name)
+        
+        # Get bucket size and object count (optional)
+        bucket_info = self._get_bucket_info(bucket_name, bucket_region)
+        
+        # Estimate S3 costs
+        billing_info = self._estimate_s3_cost(bucket_info)
+        
+        return AWSResource(
+            service='s3',
+            resource_type='bucket',
+            identifier=bucket_name,
+            name=bucket_name,
+            region=bucket_region,
+            metadata={
+                'creation_date': creation_date,
+                'region': bucket_region,
+                'objects': bucket_info['objects'],
+                'size': bucket_info['size']
+            },
+            state=ResourceState.AVAILABLE,
+            billing_info=billing_info
+        )
+    
+    def _get_bucket_region(self, bucket_name: str) -> str:
+        """Look up a bucket's region when list-buckets did not report it."""
+        with self._bucket_regions_lock:
+            region = self._load_bucket_regions().get(bucket_name)
+        if region is None:
+            # Looked up without the lock, so other buckets aren't held up meanwhile
+            region = self._lookup_bucket_region(bucket_name)
+            if region != 'unknown':
+                with self._bucket_regions_lock:
+                    self._bucket_regions[bucket_name] = region
+        return region
+    
+    def _lookup_bucket_region(self, bucket_name: str) -> str:
+        """Ask S3 for a bucket's region."""
+        # HeadBucket reports the region (x-amz-bucket-region) from any endpoint and is
+        # cheaper than GetBucketLocation, which stays as the fallback when HEAD is denied
+        try:
+            head_response = self._run_hedged_command([
+                's3api', 'head-bucket',
+                '--bucket', bucket_name,
+                '--output', 'json'
+            ])
+            if head_response.get('BucketRegion'):
+                return head_response['BucketRegion']
+        except Exception:
+            pass
+        
+        try:
+            location_response = self._run_aws_command([
+                's3api', 'get-bucket-location',
                 '--bucket', bucket_name,
-                '--query', 'length(Contents[])',
                 '--output', 'json'
             ])
-            info['objects'] = response or 0
+            return location_response.get('LocationConstraint') or 'us-east-1'
+        except Exception:
+            return 'unknown'
+    
+    def _run_hedged_command(self, cmd_args: List[str]) -> Dict[str, Any]:
+        """Run a read-only AWS CLI command, racing a duplicate if the first one stalls."""
+        # Raced attempts are single calls. A throttled one is retried below with the
+        # usual backoff and no duplicate, since hedging would add load to the throttled API.
+        try:
+            return self._race_command(cmd_args)
+        except ResourceDiscoveryError as e:
+            if not any(code in str(e) for code in THROTTLE_ERROR_CODES):
+                raise
+        return self._run_aws_command(cmd_args)
+    
+    def _race_command(self, cmd_args: List[str]) -> Dict[str, Any]:
+        """Run one attempt of a command, adding a duplicate attempt if it stalls."""
+        attempt = partial(self._run_aws_command, cmd_args, max_attempts=1)
+        pending = {self._hedge_executor.submit(attempt)}
+        done, pending = wait(pending, timeout=HEDGE_DELAY)
+        # When every slot is taken, the stalled call is simply waited on
+        if not done and self._hedge_slots.acquire(blocking=False):
+            hedge = self._hedge_executor.submit(attempt)
+            hedge.add_done_callback(lambda _: self._hedge_slots.release())
+            pending.add(hedge)
+        
+        # Return the first success; only fail once every attempt has failed. The
+        # other attempt keeps running to completion and its result is dropped.
+        while True:
+            if not done:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            if future.exception() is None or not (done or pending):
+                return future.result()
+    
+    def _get_bucket_info(self, bucket_name: str, bucket_region: str) -> dict:
+        """Get bucket size and object count from S3's daily CloudWatch storage metrics."""
+        # One fixed-cost metrics call each, instead of listing every object in the bucket
+        objects = self._get_bucket_metric(bucket_name, bucket_region, 'NumberOfObjects', 'AllStorageTypes')
+        return {
+            'objects': int(objects or 0),
+            'size': self._get_bucket_size(bucket_name, bucket_region)
+        }
+    
+    def _get_bucket_size(self, bucket_name: str, bucket_region: str) -> Optional[int]:
+        """Get a bucket's size over all storage classes, or None if none is published yet."""
+        if bucket_region == 'unknown':
+            return None
+        
+        # BucketSizeBytes is published per storage class; one search returns them all
+        search = (f"SEARCH('{{AWS/S3,BucketName,StorageType}} MetricName=\"BucketSizeBytes\" "
+                  f"BucketName=\"{bucket_name}\"', 'Average', 86400)")
+        end_time = datetime.now(timezone.utc)
+        try:
+            response = self._run_hedged_command([
+                'cloudwatch', 'get-metric-data',
+                '--region', bucket_region,
+                '--metric-data-queries', json.dumps([{'Id': 'size', 'Expression': search}]),
+                '--start-time', (end_time - timedelta(days=2)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                '--end-time', end_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                '--output', 'json'
+            ])
         except Exception:
-            pass  # Non-critical information
+            logger.debug("Could not read BucketSizeBytes for bucket %s", bucket_name, exc_info=True)
+            return None
         
-        return info
+        # Values come newest first, so each storage class contributes its first one
+        latest = [result['Values'][0] for result in response.get('MetricDataResults', []) if result.get('Values')]
+        return int(sum(latest)) if latest else None
+    
+    def _get_bucket_metric(self, bucket_name: str, bucket_region: str, metric_name: str, storage_type: str) -> Optional[float]:
+        """Get the latest daily value of an AWS/S3 storage metric, or None if none is published yet."""
+        if bucket_region == 'unknown':
+            return None
+        
+        end_time = datetime.now(timezone.utc)
+        try:
+            response = self._run_hedged_command([
+                'cloudwatch', 'get-metric-statistics',
+                '--region', bucket_region,
+                '--namespace', 'AWS/S3',
+                '--metric-name', metric_name,
+                '--dimensions', f'Name=BucketName,Value={bucket_name}', f'Name=StorageType,Value={storage_type}',
+                '--start-time', (end_time - timedelta(days=2)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                '--end-time', end_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                '--period', '86400',
+                '--statistics', 'Average',
+                '--output', 'json'
+            ])
+        except Exception:
+            # Throttling is already retried with backoff; anything left is non-critical
+            logger.debug("Could not read %s for bucket %s", metric_name, bucket_name, exc_info=True)
+            return None
+        
+        datapoints = response.get('Datapoints') or []
+        if not datapoints:
+            return None
+        return max(datapoints, key=lambda point: point.get('Timestamp', '')).get('Average', 0)
     
     def delete_resource(self, resource: AWSResource) -> bool:
         """Delete an S3 bucket."""
         try:
-            # First, try to empty the bucket
-            empty_success = self._run_aws_command_simple([
-                's3', 'rm', f's3://{resource.identifier}',
-                '--recursive'
-            ])
+            region = resource.region
+            try:
+                self._delete_bucket(resource.identifier, region)
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors='replace') if e.stderr else ''
+                if not any(code in stderr for code in REGION_REDIRECT_CODES):
+                    raise
+                # The remembered region is stale; look it up again and retry once
+                self._forget_bucket_region(resource.identifier)
+                region = self._get_bucket_region(resource.identifier)
+                self._save_bucket_regions()
+                self._delete_bucket(resource.identifier, region)
             
-            # Then delete the bucket
-            if empty_success:
-                return self._run_aws_command_simple([
-                    's3api', 'delete-bucket',
-                    '--bucket', resource.identifier
-                ])
-            return False
+            # The name can be re-created in another region
+            if self._forget_bucket_region(resource.identifier):
+                self._save_bucket_regions()
+            return True
             
-        except Exception as e:
-            print(f"Error deleting S3 bucket {resource.name}: {e}")
+        except subprocess.CalledProcessError as e:
+            logger.warning("Could not delete S3 bucket %s: %s", resource.name,
+                           e.stderr.decode(errors='replace').strip() if e.stderr else e)
             return False
+        except Exception:
+            logger.exception("Error deleting S3 bucket %s", resource.name)
+            return False
+    
+    def _delete_bucket(self, bucket_name: str, region: str) -> None:
+        """Empty a bucket and delete it, raising CalledProcessError if either step fails."""
+        # Talk to the bucket's own regional endpoint rather than being redirected
+        # there from the default one on every request
+        region_args = ['--region', region] if region != 'unknown' else []
+        
+        self._run_with_throttle_retry(self.aws_cmd_base + [
+            's3', 'rm', f's3://{bucket_name}',
+            '--recursive',
+            *region_args
+        ])
+        self._run_with_throttle_retry(self.aws_cmd_base + [
+            's3api', 'delete-bucket',
+            '--bucket', bucket_name,
+            *region_args
+        ])
     
     def _estimate_s3_cost(self, bucket_info: dict) -> BillingInfo:
         """Estimate S3 bucket monthly cost."""
-        object_count = bucket_info.get('objects', 0)
-        estimated_size_gb = max(object_count * 0.1, 1.0) if object_count > 0 else 1.0
-        
-        # S3 Standard pricing (simplified)
-        storage_cost = estimated_size_gb * 0.023  # $0.023 per GB-month
-        request_cost = max(object_count * 0.0004 / 1000, 0.001)  # PUT/GET requests
-        
-        monthly_cost = storage_cost + request_cost
-        
-        return BillingInfo(
-            estimated_monthly_cost=monthly_cost,
-            pricing_model="pay-per-use",
-            billing_unit="GB-month + requests",
-            usage_metrics={
-                'estimated_size_gb': estimated_size_gb,
-                'object_count': object_count,
-                'storage_class': 'STANDARD',
-                'storage_cost': storage_cost,
-                'request_cost': request_cost
-            },
-            cost_categories=["storage", "requests"]
-        )
\ No newline at end of file
+        return _bucket_billing(bucket_info.get('objects', 0), bucket_info.get('size'))
\ No newline at end of file
@@ -2,7 +2,7 @@
 Factory for creating AWS service handlers.
 """
 
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 from .base import BaseAWSService
 from .ec2_service import EC2Service
 from .s3_service import S3Service
@@ -25,14 +25,20 @@ class ServiceFactory:
         # Add more services here as they're implemented
     }
     
+    # Service handlers are stateless apart from their command prefix, so reuse them
+    _instances: Dict[Tuple[str, Tuple[str, ...]], BaseAWSService] = {}
+    
     @classmethod
     def create_service(cls, service_name: str, aws_cmd_base: List[str]) -> BaseAWSService:
-        """Create a service instance."""
+        """Get the service instance for a service name and AWS command prefix."""
         if service_name not in cls._services:
             raise ServiceNotSupportedError(f"Service '{service_name}' is not supported")
         
-        service_class = cls._services[service_name]
-        return service_class(aws_cmd_base)
+        key = (service_name, tuple(aws_cmd_base))
+        service = cls._instances.get(key)
+        if service is None:
+            service = cls._instances[key] = cls._services[service_name](list(aws_cmd_base))
+        return service
     
     @classmethod
     def get_supported_services(cls) -> List[str]:
@@ -42,4 +48,7 @@ class ServiceFactory:
     @classmethod
     def register_service(cls, service_name: str, service_class: Type[BaseAWSService]) -> None:
         """Register a new service class."""
-        cls._services[service_name] = service_class
\ No newline at end of file
+        cls._services[service_name] = service_class
+        # Drop handlers built from a class this registration replaces
+        for key in [key for key in cls._instances if key[0] == service_name]:
+            del cls._instances[key]
\ No newline at end of file
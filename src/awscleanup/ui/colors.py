@@ -49,128 +49,75 @@ class Color:
 class ColorScheme:
     """Color scheme definitions."""
     
+    __slots__ = ('name',)
+    
+    # Escape sequences are plain class attributes, built once at import
+    header = Color.BRIGHT_CYAN + Color.BOLD
+    menu_title = Color.BRIGHT_YELLOW + Color.BOLD
+    menu_item = Color.BRIGHT_WHITE
+    menu_selected = Color.BG_CYAN + Color.BLACK + Color.BOLD
+    menu_disabled = Color.BRIGHT_BLACK
+    accent = Color.BRIGHT_MAGENTA
+    success = Color.BRIGHT_GREEN
+    warning = Color.BRIGHT_YELLOW
+    error = Color.BRIGHT_RED
+    info = Color.BRIGHT_BLUE
+    border = Color.BRIGHT_CYAN
+    
     def __init__(self, name: str):
         self.name = name
-    
-    @property
-    def header(self) -> str:
-        return Color.BRIGHT_CYAN + Color.BOLD
-    
-    @property
-    def menu_title(self) -> str:
-        return Color.BRIGHT_YELLOW + Color.BOLD
-    
-    @property
-    def menu_item(self) -> str:
-        return Color.BRIGHT_WHITE
-    
-    @property
-    def menu_selected(self) -> str:
-        return Color.BG_CYAN + Color.BLACK + Color.BOLD
-    
-    @property
-    def menu_disabled(self) -> str:
-        return Color.BRIGHT_BLACK
-    
-    @property
-    def accent(self) -> str:
-        return Color.BRIGHT_MAGENTA
-    
-    @property
-    def success(self) -> str:
-        return Color.BRIGHT_GREEN
-    
-    @property
-    def warning(self) -> str:
-        return Color.BRIGHT_YELLOW
-    
-    @property
-    def error(self) -> str:
-        return Color.BRIGHT_RED
-    
-    @property
-    def info(self) -> str:
-        return Color.BRIGHT_BLUE
-    
-    @property
-    def border(self) -> str:
-        return Color.BRIGHT_CYAN
 
 
 class NeonScheme(ColorScheme):
     """Neon 80s color scheme."""
     
-    def __init__(self):
-        super().__init__("neon")
+    __slots__ = ()
     
-    @property
-    def header(self) -> str:
-        return Color.BRIGHT_MAGENTA + Color.BOLD
+    header = Color.BRIGHT_MAGENTA + Color.BOLD
+    menu_selected = Color.BG_MAGENTA + Color.BRIGHT_WHITE + Color.BOLD
+    accent = Color.BRIGHT_CYAN
     
-    @property
-    def menu_selected(self) -> str:
-        return Color.BG_MAGENTA + Color.BRIGHT_WHITE + Color.BOLD
-    
-    @property
-    def accent(self) -> str:
-        return Color.BRIGHT_CYAN
+    def __init__(self):
+        super().__init__("neon")
 
 
 class MatrixScheme(ColorScheme):
     """Matrix green color scheme."""
     
-    def __init__(self):
-        super().__init__("matrix")
-    
-    @property
-    def header(self) -> str:
-        return Color.BRIGHT_GREEN + Color.BOLD
+    __slots__ = ()
     
-    @property
-    def menu_title(self) -> str:
-        return Color.BRIGHT_GREEN + Color.BOLD
+    header = Color.BRIGHT_GREEN + Color.BOLD
+    menu_title = Color.BRIGHT_GREEN + Color.BOLD
+    menu_selected = Color.BG_GREEN + Color.BLACK + Color.BOLD
+    accent = Color.GREEN
+    border = Color.BRIGHT_GREEN
     
-    @property
-    def menu_selected(self) -> str:
-        return Color.BG_GREEN + Color.BLACK + Color.BOLD
-    
-    @property
-    def accent(self) -> str:
-        return Color.GREEN
-    
-    @property
-    def border(self) -> str:
-        return Color.BRIGHT_GREEN
+    def __init__(self):
+        super().__init__("matrix")
 
 
 class ClassicScheme(ColorScheme):
     """Classic terminal colors."""
     
-    def __init__(self):
-        super().__init__("classic")
-    
-    @property
-    def header(self) -> str:
-        return Color.WHITE + Color.BOLD
-    
-    @property
-    def menu_title(self) -> str:
-        return Color.WHITE + Color.BOLD
+    __slots__ = ()
     
-    @property
-    def menu_selected(self) -> str:
-        return Color.REVERSE + Color.BOLD
+    header = Color.WHITE + Color.BOLD
+    menu_title = Color.WHITE + Color.BOLD
+    menu_selected = Color.REVERSE + Color.BOLD
+    accent = Color.WHITE
     
-    @property
-    def accent(self) -> str:
-        return Color.WHITE
+    def __init__(self):
+        super().__init__("classic")
+
+
+# Schemes hold no per-use state, so one shared instance of each is enough
+_SCHEMES = {
+    'neon': NeonScheme(),
+    'matrix': MatrixScheme(),
+    'classic': ClassicScheme(),
+}
 
 
 def get_color_scheme(scheme_name: str) -> ColorScheme:
     """Get color scheme by name."""
-    schemes = {
-        'neon': NeonScheme(),
-        'matrix': MatrixScheme(),
-        'classic': ClassicScheme(),
-    }
-    return schemes.get(scheme_name, NeonScheme())
\ No newline at end of file
+    return _SCHEMES.get(scheme_name, _SCHEMES['neon'])
\ No newline at end of file
@@ -2,77 +2,219 @@
 80s-style retro terminal user interface.
 """
 
+import re
+import sys
 import time
 import random
-from typing import List, Optional, Callable, Any, Dict
+from collections import deque
+from functools import lru_cache
+from typing import List, Optional, Callable, Any, Dict, Tuple
 from .colors import Color, get_color_scheme
 from .terminal import Terminal, RetroEffects
 from ..core.models import MenuItem, AWSResource, CleanupSession, EnvironmentType
 
 
+# Escape sequences, which take no space on screen
+ANSI_ESCAPE_RE = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
+
+# Multipliers for animation delays, by the animation_speed UI setting
+ANIMATION_DELAY_SCALES = {'slow': 2.0, 'normal': 1.0, 'fast': 0.2, 'off': 0.0}
+
+# Row layouts: service, type, name (cut to its column) and region or cost and pricing model
+RESOURCE_ROW_FORMAT = "%-10s %-15s %-30.30s %-15s "
+BILLING_ROW_FORMAT = "%-11s %-19s %-24.24s %-15s %-12s"
+
+# Shortest time between two progress frames; quicker updates are folded into the next one
+PROGRESS_FRAME_INTERVAL = 1 / 30
+
+# Key names as returned by Terminal.get_key
+KONAMI_CODE = ('UP', 'UP', 'DOWN', 'DOWN', 'LEFT', 'RIGHT', 'LEFT', 'RIGHT', 'b', 'a')
+
+# ASCII art logo
+LOGO = (
+    "  ██████╗ ██╗      ██████╗ ██╗   ██╗██████╗     ██████╗ ██╗     ███████╗ █████╗ ███╗   ██╗███████╗██████╗ ",
+    " ██╔════╝ ██║     ██╔═══██╗██║   ██║██╔══██╗   ██╔════╝ ██║     ██╔════╝██╔══██╗████╗  ██║██╔════╝██╔══██╗",
+    " ██║      ██║     ██║   ██║██║   ██║██║  ██║   ██║  ███╗██║     █████╗  ███████║██╔██╗ ██║█████╗  ██████╔╝",
+    " ██║      ██║     ██║   ██║██║   ██║██║  ██║   ██║   ██║██║     ██╔══╝  ██╔══██║██║╚██╗██║██╔══╝  ██╔══██╗",
+    " ╚██████╗ ███████╗╚██████╔╝╚██████╔╝██████╔╝   ╚██████╔╝███████╗███████╗██║  ██║██║ ╚████║███████╗██║  ██║",
+    "  ╚═════╝ ╚══════╝ ╚═════╝  ╚═════╝ ╚═════╝     ╚═════╝ ╚══════╝╚══════╝╚═╝  ╚═╝╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝",
+    "",
+    "                                    ┌─── AWS RESOURCE CLEANUP TOOL ───┐",
+    "                                    │        RETRO EDITION           │",
+    "                                    └─────────────────────────────────┘"
+)
+
+# Splash screen taglines, one picked at random per launch
+FLAVOR_TEXTS = (
+    "⚡ INITIALIZING QUANTUM FLUX CAPACITORS ⚡",
+    "🌐 CONNECTING TO THE MAINFRAME 🌐",
+    "🔥 LOADING CYBER PROTOCOLS 🔥",
+    "✨ SYNCING WITH THE MATRIX ✨"
+)
+
+EASTER_EGG_MESSAGES = (
+    "🎮 KONAMI CODE DETECTED! 🎮",
+    "",
+    "WELCOME TO THE MATRIX, NEO...",
+    "",
+    "You have unlocked the secret retro mode!",
+    "All your base are belong to us.",
+    "",
+    "Press any key to continue..."
+)
+
+
+def _render_centered(lines, width: int, start_y: int, color: str) -> str:
+    """Build lines centered horizontally from start_y down as one positioned string."""
+    return ''.join(
+        Terminal.at((width - len(line)) // 2, start_y + i, f"{color}{line}{Color.RESET}")
+        for i, line in enumerate(lines)
+    )
+
+
+@lru_cache(maxsize=8)
+def _render_logo(width: int, start_y: int, header: str, accent: str) -> str:
+    """Build the centered splash logo, its banner in the accent color."""
+    banner = len(LOGO) - 3
+    return (_render_centered(LOGO[:banner], width, start_y, header) +
+            _render_centered(LOGO[banner:], width, start_y + banner, accent))
+
+
+@lru_cache(maxsize=4)
+def _render_easter_egg(width: int, height: int, color: str) -> str:
+    """Build the easter egg message, centered on a screen of the given size."""
+    return _render_centered(EASTER_EGG_MESSAGES, width, (height - len(EASTER_EGG_MESSAGES)) // 2, color)
+
+
+@lru_cache(maxsize=32)
+def _render_box(x: int, y: int, width: int, height: int, title: str, border: str) -> str:
+    """Build a positioned retro-style box; boxes repeat across redraws, so they are cached."""
+    at = Terminal.at
+    
+    # Top border, with the title centered in it
+    if title:
+        left = max(0, (width - len(title) - 4) // 2 - 1)
+        right = max(0, width - len(title) - 6 - left)
+        top_line = "".join(("╔", "═" * left, "╣ ", title, " ╠", "═" * right, "╗"))
+    else:
+        top_line = "╔" + "═" * (width - 2) + "╗"
+    parts = [at(x, y, f"{border}{top_line}{Color.RESET}")]
+    
+    # Side borders; the inside is left alone since boxes are drawn on a cleared screen
+    edge = f"{border}║{Color.RESET}"
+    right = x + width - 1
+    parts.extend(at(x, y + i, edge) + at(right, y + i, edge) for i in range(1, height - 1))
+    
+    # Bottom border
+    parts.append(at(x, y + height - 1, f"{border}╚{'═' * (width - 2)}╝{Color.RESET}"))
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=128)
+def _bar(filled: int, width: int) -> str:
+    """Build a bar of filled blocks then empty ones; the same few bars recur on every redraw."""
+    return "█" * filled + "░" * (width - filled)
+
+
+def _visible_len(text: str) -> int:
+    """Length of text as displayed, ignoring escape sequences."""
+    return len(ANSI_ESCAPE_RE.sub('', text))
+
+
 class RetroUI:
     """80s-style terminal user interface."""
     
-    def __init__(self, color_scheme: str = "neon"):
+    def __init__(self, color_scheme: str = "neon", animation_speed: str = "normal"):
         self.terminal = Terminal()
         self.colors = get_color_scheme(color_scheme)
         self.selected_index = 0
         self.easter_egg_triggered = False
+        self._key_history = deque(maxlen=len(KONAMI_CODE))
+        # Animations are only worth their delays when someone is watching a terminal
+        self._interactive = sys.stdout.isatty()
+        self._delay_scale = ANIMATION_DELAY_SCALES.get(animation_speed, 1.0) if self._interactive else 0.0
+        # Last frame drawn by _draw_frame: (clear count, size, background, rows)
+        self._frame = None
+        # time.monotonic() of the last progress frame, for _should_render
+        self._last_render = 0.0
+        
+        # Colored fragments reused by every frame; only labels vary per row
+        self._selected_prefix = f"{self.colors.menu_selected}▶ "
+        self._item_prefix = f"{self.colors.menu_item}  "
+        self._disabled_prefix = f"{self.colors.menu_disabled}  "
+        self._hotkey_prefix = f" {self.colors.accent}["
+        self._hotkey_suffix = f"]{Color.RESET}"
+        self._env_indicators = {
+            EnvironmentType.PRODUCTION: f"{self.colors.error}🔴 PRODUCTION{Color.RESET}",
+            EnvironmentType.STAGING: f"{self.colors.warning}🟡 STAGING{Color.RESET}",
+            EnvironmentType.DEVELOPMENT: f"{self.colors.success}🟢 DEV{Color.RESET}",
+            EnvironmentType.TESTING: f"{self.colors.info}🔵 TEST{Color.RESET}",
+            EnvironmentType.PROTECTED: f"{self.colors.error}🔒 PROTECTED{Color.RESET}",
+            EnvironmentType.SAFE: f"{self.colors.success}✅ SAFE{Color.RESET}",
+            EnvironmentType.UNKNOWN: f"{self.colors.warning}⚠️ UNKNOWN{Color.RESET}"
+        }
         
     def show_splash_screen(self):
         """Show awesome 80s splash screen."""
+        if not self._interactive:
+            return
+        
         self.terminal.clear_screen()
         self.terminal.hide_cursor()
         
-        # ASCII art logo
-        logo = [
-            "  ██████╗ ██╗      ██████╗ ██╗   ██╗██████╗     ██████╗ ██╗     ███████╗ █████╗ ███╗   ██╗███████╗██████╗ ",
-            " ██╔════╝ ██║     ██╔═══██╗██║   ██║██╔══██╗   ██╔════╝ ██║     ██╔════╝██╔══██╗████╗  ██║██╔════╝██╔══██╗",
-            " ██║      ██║     ██║   ██║██║   ██║██║  ██║   ██║  ███╗██║     █████╗  ███████║██╔██╗ ██║█████╗  ██████╔╝",
-            " ██║      ██║     ██║   ██║██║   ██║██║  ██║   ██║   ██║██║     ██╔══╝  ██╔══██║██║╚██╗██║██╔══╝  ██╔══██╗",
-            " ╚██████╗ ███████╗╚██████╔╝╚██████╔╝██████╔╝   ╚██████╔╝███████╗███████╗██║  ██║██║ ╚████║███████╗██║  ██║",
-            "  ╚═════╝ ╚══════╝ ╚═════╝  ╚═════╝ ╚═════╝     ╚═════╝ ╚══════╝╚══════╝╚═╝  ╚═╝╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝",
-            "",
-            "                                    ┌─── AWS RESOURCE CLEANUP TOOL ───┐",
-            "                                    │        RETRO EDITION           │",
-            "                                    └─────────────────────────────────┘"
-        ]
-        
-        # Center and display logo with effects
+        # Center and display logo
+        logo = LOGO
         width = self.terminal.width
         height = self.terminal.height
         
         start_y = max(1, (height - len(logo)) // 2 - 3)
         
-        for i, line in enumerate(logo):
-            self.terminal.move_cursor((width - len(line)) // 2, start_y + i)
-            if i < len(logo) - 3:
-                print(f"{self.colors.header}{line}{Color.RESET}")
-            else:
-                print(f"{self.colors.accent}{line}{Color.RESET}")
-            time.sleep(0.1)
+        self.terminal.write(_render_logo(width, start_y, self.colors.header, self.colors.accent))
+        self._pause(1.0)
         
         # Add some retro flavor text
-        flavor_texts = [
-            "⚡ INITIALIZING QUANTUM FLUX CAPACITORS ⚡",
-            "🌐 CONNECTING TO THE MAINFRAME 🌐",
-            "🔥 LOADING CYBER PROTOCOLS 🔥",
-            "✨ SYNCING WITH THE MATRIX ✨"
-        ]
-        
-        flavor = random.choice(flavor_texts)
+        flavor = random.choice(FLAVOR_TEXTS)
         self.terminal.move_cursor((width - len(flavor)) // 2, start_y + len(logo) + 2)
-        RetroEffects.typewriter_print(f"{self.colors.info}{flavor}{Color.RESET}")
+        RetroEffects.typewriter_print(f"{self.colors.info}{flavor}{Color.RESET}", 0.03 * self._delay_scale)
         
-        time.sleep(1.5)
+        self._pause(1.5)
         self.terminal.show_cursor()
+        self.terminal.flush()
+    
+    def _pause(self, seconds: float):
+        """Show what has been drawn and hold it for an animation delay, scaled by animation speed."""
+        self.terminal.flush()
+        if self._delay_scale:
+            time.sleep(seconds * self._delay_scale)
+    
+    def _should_render(self, min_interval: float = PROGRESS_FRAME_INTERVAL) -> bool:
+        """Return whether enough time has passed since the last frame to draw another."""
+        now = time.monotonic()
+        if now - self._last_render < min_interval:
+            return False
+        self._last_render = now
+        return True
     
     def show_main_menu(self, session: CleanupSession, menu_items: List[MenuItem]) -> str:
         """Show main menu with arrow key navigation."""
+        self._frame = None
+        hotkeys = {
+            item.hotkey.lower(): i
+            for i, item in enumerate(menu_items)
+            if item.hotkey and item.enabled
+        }
+        
         while True:
             self._draw_main_menu(session, menu_items)
             
             key = self.terminal.get_key()
+            self._key_history.append(key)
+            
+            if session.account_info and not self.easter_egg_triggered and self._check_konami_sequence():
+                # Konami code easter egg trigger
+                self._trigger_easter_egg()
+                self.easter_egg_triggered = True
+                continue
             
             if key == 'UP':
                 self.selected_index = (self.selected_index - 1) % len(menu_items)
@@ -84,49 +226,39 @@ class RetroUI:
                     return selected_item.action
             elif key == 'CTRL_C' or key == 'CTRL_Q' or key == 'ESCAPE':
                 return 'exit'
-            elif key.lower() == 'k' and session.account_info and not self.easter_egg_triggered:
-                # Konami code easter egg trigger
-                if self._check_konami_sequence():
-                    self._trigger_easter_egg()
-                    self.easter_egg_triggered = True
+            elif self._in_konami_sequence():
+                # Don't let the code's letters fire hotkeys halfway through
+                continue
             
             # Handle hotkeys
-            for i, item in enumerate(menu_items):
-                if item.hotkey and key.lower() == item.hotkey.lower() and item.enabled:
-                    self.selected_index = i
-                    return item.action
+            i = hotkeys.get(key.lower())
+            if i is not None:
+                self.selected_index = i
+                return menu_items[i].action
     
     def _draw_main_menu(self, session: CleanupSession, menu_items: List[MenuItem]):
         """Draw the main menu interface."""
-        self.terminal.clear_screen()
         width = self.terminal.width
         
         # Header
-        self._draw_header(session)
+        rows = self._header_rows(session)
         
         # Menu box
         menu_start_y = 8
-        self._draw_box(5, menu_start_y, width - 10, len(menu_items) + 4, "MAIN MENU")
+        background = _render_box(5, menu_start_y, width - 10, len(menu_items) + 4, "MAIN MENU", self.colors.border)
         
         # Menu items
         for i, item in enumerate(menu_items):
-            y = menu_start_y + 2 + i
-            x = 8
-            
             if i == self.selected_index:
                 # Selected item
-                prefix = f"{self.colors.menu_selected}▶ {item.label} {Color.RESET}"
-                if item.hotkey:
-                    prefix += f" {self.colors.accent}[{item.hotkey}]{Color.RESET}"
+                prefix = self._selected_prefix + item.label + " " + Color.RESET
             else:
                 # Regular item
-                color = self.colors.menu_item if item.enabled else self.colors.menu_disabled
-                prefix = f"{color}  {item.label}{Color.RESET}"
-                if item.hotkey:
-                    prefix += f" {self.colors.accent}[{item.hotkey}]{Color.RESET}"
+                prefix = (self._item_prefix if item.enabled else self._disabled_prefix) + item.label + Color.RESET
+            if item.hotkey:
+                prefix += self._hotkey_prefix + item.hotkey + self._hotkey_suffix
             
-            self.terminal.move_cursor(x, y)
-            print(prefix)
+            rows[(8, menu_start_y + 2 + i)] = prefix
         
         # Footer with controls
         footer_y = menu_start_y + len(menu_items) + 6
@@ -135,17 +267,17 @@ class RetroUI:
         ]
         
         control_text = " | ".join(controls)
-        self.terminal.move_cursor((width - len(control_text)) // 2, footer_y)
-        print(f"{self.colors.info}{control_text}{Color.RESET}")
+        rows[((width - len(control_text)) // 2, footer_y)] = f"{self.colors.info}{control_text}{Color.RESET}"
+        
+        self._draw_frame(background, rows)
     
-    def _draw_header(self, session: CleanupSession):
-        """Draw the header with account information."""
+    def _header_rows(self, session: CleanupSession) -> Dict[Tuple[int, int], str]:
+        """Build the header rows with account information."""
         width = self.terminal.width
         
         # Title bar
         title = "═══ CLOUD CLEANER - RETRO EDITION ═══"
-        self.terminal.move_cursor((width - len(title)) // 2, 2)
-        print(f"{self.colors.header}{title}{Color.RESET}")
+        rows = {((width - len(title)) // 2, 2): f"{self.colors.header}{title}{Color.RESET}"}
         
         if session.account_info:
             # Account info
@@ -160,40 +292,50 @@ class RetroUI:
             ]
             
             for i, line in enumerate(info_lines):
-                self.terminal.move_cursor(3, 4 + i)
-                print(f"{self.colors.info}{line}{Color.RESET}")
+                rows[(3, 4 + i)] = f"{self.colors.info}{line}{Color.RESET}"
+        
+        return rows
+    
+    def _draw_frame(self, background: str, rows: Dict[Tuple[int, int], str]):
+        """Draw a screen, repainting only the rows that changed since the previous frame.
+        
+        The background (boxes and other static, already positioned text) and each
+        single-line row keyed by its (x, y) are compared with what is on screen. The
+        whole screen is repainted when it was cleared or resized, or the background
+        changed; otherwise only changed rows are written, padded with spaces so a
+        shorter row leaves nothing of the old one behind.
+        """
+        size = self.terminal.size()
+        previous = self._frame
+        if (previous is None or previous[0] != self.terminal.clear_count
+                or previous[1] != size or previous[2] != background):
+            self.terminal.clear_screen()
+            out = [background]
+            old_rows = {}
+        else:
+            out = []
+            old_rows = previous[3]
+        
+        at = self.terminal.at
+        for pos, text in rows.items():
+            old = old_rows.get(pos)
+            if old != text:
+                padding = _visible_len(old) - _visible_len(text) if old else 0
+                out.append(at(pos[0], pos[1], text + " " * padding))
+        for pos, old in old_rows.items():
+            if pos not in rows:
+                out.append(at(pos[0], pos[1], " " * _visible_len(old)))
+        
+        self.terminal.write(''.join(out))
+        self._frame = (self.terminal.clear_count, size, background, rows)
     
     def _draw_box(self, x: int, y: int, width: int, height: int, title: str = ""):
         """Draw a retro-style box."""
-        # Top border
-        self.terminal.move_cursor(x, y)
-        top_line = "╔" + "═" * (width - 2) + "╗"
-        if title:
-            title_pos = (width - len(title) - 4) // 2
-            top_line = top_line[:title_pos] + f"╣ {title} ╠" + top_line[title_pos + len(title) + 4:]
-        print(f"{self.colors.border}{top_line}{Color.RESET}")
-        
-        # Side borders
-        for i in range(1, height - 1):
-            self.terminal.move_cursor(x, y + i)
-            print(f"{self.colors.border}║{Color.RESET}" + " " * (width - 2) + f"{self.colors.border}║{Color.RESET}")
-        
-        # Bottom border
-        self.terminal.move_cursor(x, y + height - 1)
-        print(f"{self.colors.border}╚" + "═" * (width - 2) + "╝{Color.RESET}")
+        self.terminal.write(_render_box(x, y, width, height, title, self.colors.border))
     
     def _get_environment_indicator(self, env_type: EnvironmentType) -> str:
         """Get visual indicator for environment type."""
-        indicators = {
-            EnvironmentType.PRODUCTION: f"{self.colors.error}🔴 PRODUCTION{Color.RESET}",
-            EnvironmentType.STAGING: f"{self.colors.warning}🟡 STAGING{Color.RESET}",
-            EnvironmentType.DEVELOPMENT: f"{self.colors.success}🟢 DEV{Color.RESET}",
-            EnvironmentType.TESTING: f"{self.colors.info}🔵 TEST{Color.RESET}",
-            EnvironmentType.PROTECTED: f"{self.colors.error}🔒 PROTECTED{Color.RESET}",
-            EnvironmentType.SAFE: f"{self.colors.success}✅ SAFE{Color.RESET}",
-            EnvironmentType.UNKNOWN: f"{self.colors.warning}⚠️ UNKNOWN{Color.RESET}"
-        }
-        return indicators.get(env_type, "❓ UNCLASSIFIED")
+        return self._env_indicators.get(env_type, "❓ UNCLASSIFIED")
     
     def show_resource_list(self, resources: List[AWSResource], selected_resources: set) -> Optional[int]:
         """Show resource list with selection interface."""
@@ -206,42 +348,42 @@ class RetroUI:
         max_pages = (len(resources) - 1) // page_size + 1
         selected_index = 0
         
+        # Row text apart from the selection markers never changes while browsing
+        bodies = [
+            RESOURCE_ROW_FORMAT % (r.service, r.resource_type, r.display_name, r.region)
+            for r in resources
+        ]
+        selected_status = f"{self.colors.warning}[SELECTED]{Color.RESET}"
+        
+        self._frame = None
         while True:
-            self.terminal.clear_screen()
-            
             # Header
             title = f"RESOURCES (Page {current_page + 1}/{max_pages})"
-            self._draw_box(2, 2, self.terminal.width - 4, self.terminal.height - 4, title)
+            background = _render_box(2, 2, self.terminal.width - 4, self.terminal.height - 4, title, self.colors.border)
+            
+            # Controls
+            controls = ["↑↓ Navigate", "SPACE Select", "ENTER Details", "ESC Back", "PgUp/PgDn Pages"]
+            control_text = " | ".join(controls)
+            background += self.terminal.at(5, self.terminal.height - 2, f"{self.colors.info}{control_text}{Color.RESET}")
             
             # Resource list
             start_idx = current_page * page_size
             end_idx = min(start_idx + page_size, len(resources))
             
+            rows = {}
             for i in range(start_idx, end_idx):
-                resource = resources[i]
-                y = 4 + (i - start_idx)
-                x = 5
-                
                 # Selection indicator
-                if resource.identifier in selected_resources:
-                    status = f"{self.colors.warning}[SELECTED]{Color.RESET}"
-                else:
-                    status = ""
+                status = selected_status if resources[i].identifier in selected_resources else ""
                 
                 # Highlight current selection
                 if i == selected_index:
-                    line = f"{self.colors.menu_selected}▶ {resource.service:<10} {resource.resource_type:<15} {resource.display_name[:30]:<30} {resource.region:<15} {status}{Color.RESET}"
+                    line = self._selected_prefix + bodies[i] + status + Color.RESET
                 else:
-                    line = f"  {resource.service:<10} {resource.resource_type:<15} {resource.display_name[:30]:<30} {resource.region:<15} {status}"
+                    line = "  " + bodies[i] + status
                 
-                self.terminal.move_cursor(x, y)
-                print(line)
+                rows[(5, 4 + (i - start_idx))] = line
             
-            # Controls
-            controls = ["↑↓ Navigate", "SPACE Select", "ENTER Details", "ESC Back", "PgUp/PgDn Pages"]
-            control_text = " | ".join(controls)
-            self.terminal.move_cursor(5, self.terminal.height - 2)
-            print(f"{self.colors.info}{control_text}{Color.RESET}")
+            self._draw_frame(background, rows)
             
             # Handle input
             key = self.terminal.get_key()
@@ -258,6 +400,7 @@ class RetroUI:
                 return selected_index
             elif key == 'ENTER':
                 self.show_resource_details(resources[selected_index])
+                self._frame = None
             elif key == 'ESCAPE':
                 return None
             elif key in ['PAGE_UP', 'b']:
@@ -309,10 +452,10 @@ class RetroUI:
         for i, line in enumerate(details):
             if i < self.terminal.height - 6:
                 self.terminal.move_cursor(5, 4 + i)
-                print(f"{self.colors.info}{line}{Color.RESET}")
+                self.terminal.write(f"{self.colors.info}{line}{Color.RESET}")
         
         self.terminal.move_cursor(5, self.terminal.height - 2)
-        print(f"{self.colors.info}Press any key to continue...{Color.RESET}")
+        self.terminal.write(f"{self.colors.info}Press any key to continue...{Color.RESET}")
         
         self.terminal.get_key()
     
@@ -331,8 +474,7 @@ class RetroUI:
         self.terminal.clear_screen()
         
         lines = message.split('\n')
-        max_length = max(len(line) for line in lines)
-        box_width = min(self.terminal.width - 4, max_length + 4)
+        box_width = min(self.terminal.width - 4, max(map(len, lines)) + 4)
         box_height = len(lines) + 4
         
         x = (self.terminal.width - box_width) // 2
@@ -340,44 +482,32 @@ class RetroUI:
         
         self._draw_box(x, y, box_width, box_height, msg_type.upper())
         
-        for i, line in enumerate(lines):
-            self.terminal.move_cursor(x + 2, y + 2 + i)
-            print(f"{color}{line}{Color.RESET}")
+        at = self.terminal.at
+        self.terminal.write(''.join(at(x + 2, y + 2 + i, f"{color}{line}{Color.RESET}")
+                                    for i, line in enumerate(lines)))
         
-        time.sleep(duration)
+        # Any key dismisses the message early
+        self.terminal.wait_for_key(duration)
     
     def _check_konami_sequence(self) -> bool:
-        """Check for Konami code easter egg (simplified)."""
-        return random.random() < 0.1  # 10% chance for demo
+        """Check whether the last keys pressed spell the Konami code."""
+        return tuple(self._key_history) == KONAMI_CODE
+    
+    def _in_konami_sequence(self) -> bool:
+        """Check whether the last keys pressed are all but the final key of the Konami code."""
+        return tuple(self._key_history)[1 - len(KONAMI_CODE):] == KONAMI_CODE[:-1]
     
     def _trigger_easter_egg(self):
         """Trigger the easter egg."""
         self.terminal.clear_screen()
         
         # Matrix rain effect
-        RetroEffects.matrix_rain(self.terminal.width, self.terminal.height, 3.0)
+        if self._delay_scale:
+            RetroEffects.matrix_rain(self.terminal.width, self.terminal.height, 3.0 * self._delay_scale)
         
         # Show easter egg message
-        messages = [
-            "🎮 KONAMI CODE DETECTED! 🎮",
-            "",
-            "WELCOME TO THE MATRIX, NEO...",
-            "",
-            "You have unlocked the secret retro mode!",
-            "All your base are belong to us.",
-            "",
-            "Press any key to continue..."
-        ]
-        
         self.terminal.clear_screen()
-        width = self.terminal.width
-        height = self.terminal.height
-        
-        start_y = (height - len(messages)) // 2
-        
-        for i, msg in enumerate(messages):
-            self.terminal.move_cursor((width - len(msg)) // 2, start_y + i)
-            print(f"{self.colors.success}{msg}{Color.RESET}")
+        self.terminal.write(_render_easter_egg(self.terminal.width, self.terminal.height, self.colors.success))
         
         self.terminal.get_key()
     
@@ -388,107 +518,145 @@ class RetroUI:
         title = "⚠️ CONFIRM DELETION ⚠️"
         self._draw_box(5, 5, self.terminal.width - 10, self.terminal.height - 10, title)
         
+        error, info = self.colors.error, self.colors.info
         messages = [
-            f"You are about to DELETE {len(resources)} AWS resources!",
-            "",
-            "This action CANNOT be undone!",
-            "",
-            "Resources to be deleted:",
-            ""
+            (error, f"You are about to DELETE {len(resources)} AWS resources!"),
+            (info, ""),
+            (error, "This action CANNOT be undone!"),
+            (info, ""),
+            (info, "Resources to be deleted:"),
+            (info, "")
         ]
         
         # Show first few resources
-        for i, resource in enumerate(resources[:10]):
-            messages.append(f"  • {resource.service}/{resource.resource_type}: {resource.display_name}")
+        messages.extend(
+            (info, f"  • {resource.service}/{resource.resource_type}: {resource.display_name}")
+            for resource in resources[:10]
+        )
         
         if len(resources) > 10:
-            messages.append(f"  ... and {len(resources) - 10} more")
+            messages.append((info, f"  ... and {len(resources) - 10} more"))
         
         messages.extend([
-            "",
-            "Type 'DELETE' to confirm, or ESC to cancel:"
+            (info, ""),
+            (error, "Type 'DELETE' to confirm, or ESC to cancel:")
         ])
         
-        for i, msg in enumerate(messages):
-            if i < self.terminal.height - 12:
-                self.terminal.move_cursor(7, 7 + i)
-                if "DELETE" in msg or "CANNOT" in msg:
-                    print(f"{self.colors.error}{msg}{Color.RESET}")
-                else:
-                    print(f"{self.colors.info}{msg}{Color.RESET}")
+        self.terminal.write(''.join(
+            self.terminal.at(7, 7 + i, f"{color}{msg}{Color.RESET}")
+            for i, (color, msg) in enumerate(messages[:max(0, self.terminal.height - 12)])
+        ))
         
         # Get confirmation
         self.terminal.move_cursor(7, 7 + len(messages))
         self.terminal.show_cursor()
         
-        confirmation = ""
+        input_y = 7 + len(messages)
+        confirmation = []
         while True:
             key = self.terminal.get_key()
             
             if key == 'ESCAPE':
                 return False
             elif key == 'ENTER':
-                return confirmation == "DELETE"
+                return ''.join(confirmation) == "DELETE"
             elif key == 'BACKSPACE':
                 if confirmation:
-                    confirmation = confirmation[:-1]
-                    self.terminal.move_cursor(7, 7 + len(messages))
-                    print(" " * 20)
-                    self.terminal.move_cursor(7, 7 + len(messages))
-                    print(f"{self.colors.warning}{confirmation}{Color.RESET}")
-            elif key.isalpha():
-                confirmation += key.upper()
-                self.terminal.move_cursor(7, 7 + len(messages))
-                print(f"{self.colors.warning}{confirmation}{Color.RESET}")
+                    # Erase just the last letter (ECH), leaving the cursor on its cell; erasing
+                    # to end of line would also wipe the box border when the prompt is inside it
+                    confirmation.pop()
+                    self.terminal.write(self.terminal.at(7 + len(confirmation), input_y, '\033[X'))
+            elif len(key) == 1 and key.isalpha():
+                # Only the new letter needs drawing; the ones before it are already on screen
+                confirmation.append(key.upper())
+                self.terminal.write(self.terminal.at(6 + len(confirmation), input_y, f"{self.colors.warning}{confirmation[-1]}{Color.RESET}"))
     
-    def show_deletion_progress(self, resources: List[AWSResource], callback: Callable[[AWSResource], bool]):
-        """Show deletion progress with retro progress bar."""
-        self.terminal.clear_screen()
+    def show_deletion_progress(self, batches: List[List[AWSResource]],
+                               callback: Callable[[List[AWSResource]], Dict[str, bool]]):
+        """Show deletion progress with retro progress bar, one step per batch of like resources."""
+        self._frame = None
         self.terminal.hide_cursor()
         
+        # The empty bar is part of the background; each step only fills in its growth
+        bar_width = self.terminal.width - 20
         title = "DELETION IN PROGRESS"
-        self._draw_box(5, 5, self.terminal.width - 10, 15, title)
-        
-        total = len(resources)
-        
-        for i, resource in enumerate(resources):
-            # Progress bar
-            progress = (i + 1) / total
-            bar_width = self.terminal.width - 20
-            filled = int(bar_width * progress)
-            
-            self.terminal.move_cursor(7, 8)
-            print(f"{self.colors.info}Progress: {i + 1}/{total}{Color.RESET}")
-            
-            self.terminal.move_cursor(7, 10)
-            bar = "█" * filled + "░" * (bar_width - filled)
-            print(f"{self.colors.success}[{bar}] {progress:.1%}{Color.RESET}")
-            
-            # Current resource
-            self.terminal.move_cursor(7, 12)
-            print(f"{self.colors.info}Deleting: {resource.service}/{resource.resource_type}{Color.RESET}")
-            self.terminal.move_cursor(7, 13)
-            print(f"{self.colors.info}Name: {resource.display_name[:50]}{Color.RESET}")
-            
-            # Delete resource
-            success = callback(resource)
-            
-            # Show result
-            self.terminal.move_cursor(7, 15)
-            if success:
-                print(f"{self.colors.success}✓ Successfully deleted{Color.RESET}")
+        background = (_render_box(5, 5, self.terminal.width - 10, 15, title, self.colors.border) +
+                      self.terminal.at(7, 10, f"{self.colors.success}[{'░' * bar_width}]{Color.RESET}"))
+        
+        total = sum(len(batch) for batch in batches)
+        rows = {}
+        drawn = 0
+        done = 0
+        failed = 0
+        self._last_render = 0.0
+        
+        for batch in batches:
+            # Current batch; a batch of one is shown by name
+            first = batch[0]
+            if len(batch) == 1:
+                rows[(7, 12)] = f"{self.colors.info}Deleting: {first.service}/{first.resource_type}{Color.RESET}"
+                rows[(7, 13)] = f"{self.colors.info}Name: {first.display_name[:50]}{Color.RESET}"
             else:
-                print(f"{self.colors.error}✗ Failed to delete{Color.RESET}")
-            
-            time.sleep(0.5)
+                rows[(7, 12)] = f"{self.colors.info}Deleting: {len(batch)} resources of type {first.service}/{first.resource_type}{Color.RESET}"
+                rows[(7, 13)] = f"{self.colors.info}Region: {first.region}{Color.RESET}"
+            
+            # Deletions that finish quickly are folded into the next frame
+            if self._should_render():
+                drawn = self._draw_progress(background, rows, self._progress_rows(rows, done, total, bar_width), drawn)
+                self.terminal.flush()
+            
+            # Delete the batch, then report each resource's own result
+            results = callback(batch)
+            failures = [r.display_name for r in batch if not results.get(r.identifier)]
+            done += len(batch)
+            failed += len(failures)
+            
+            if not failures:
+                deleted = "" if len(batch) == 1 else f" {len(batch)} resources"
+                rows[(7, 15)] = f"{self.colors.success}✓ Successfully deleted{deleted}{Color.RESET}"
+            elif len(batch) == 1:
+                rows[(7, 15)] = f"{self.colors.error}✗ Failed to delete{Color.RESET}"
+            else:
+                rows[(7, 15)] = f"{self.colors.error}✗ Failed to delete {len(failures)} of {len(batch)}: {', '.join(failures)[:50]}{Color.RESET}"
+        
+        # The final state is always shown, however recently the last frame was drawn
+        if batches:
+            self._draw_progress(background, rows, self._progress_rows(rows, done, total, bar_width), drawn)
         
         self.terminal.move_cursor(7, 17)
-        print(f"{self.colors.success}Deletion complete! Press any key to continue...{Color.RESET}")
+        if failed:
+            self.terminal.write(f"{self.colors.warning}Deletion complete, {failed} of {total} failed. Press any key to continue...{Color.RESET}")
+        else:
+            self.terminal.write(f"{self.colors.success}Deletion complete! Press any key to continue...{Color.RESET}")
         self.terminal.show_cursor()
         self.terminal.get_key()
     
+    def _progress_rows(self, rows: Dict[Tuple[int, int], str], done: int, total: int, bar_width: int) -> int:
+        """Fill in the progress count and percentage rows; return the bar cells to fill."""
+        # Integer arithmetic; tenths of a percent are rounded half up
+        per_mille = (done * 2000 + total) // (2 * total)
+        rows[(7, 8)] = f"{self.colors.info}Progress: {done}/{total}{Color.RESET}"
+        rows[(bar_width + 10, 10)] = f"{self.colors.success}{per_mille // 10}.{per_mille % 10}%{Color.RESET}"
+        return done * bar_width // total
+    
+    def _draw_progress(self, background: str, rows: Dict[Tuple[int, int], str], filled: int, drawn: int) -> int:
+        """Draw a deletion progress frame and grow the bar to filled cells; return the cells now shown."""
+        clears = self.terminal.clear_count
+        self._draw_frame(background, dict(rows))
+        if self.terminal.clear_count != clears:
+            # Repainted from scratch, so the bar is empty again
+            drawn = 0
+        if filled > drawn:
+            self.terminal.write(self.terminal.at(8 + drawn, 10, f"{self.colors.success}{'█' * (filled - drawn)}{Color.RESET}"))
+            drawn = filled
+        return drawn
+    
     def show_billing_inventory(self, billing_report: Dict, resources: List['AWSResource']) -> Optional[str]:
         """Show comprehensive billing inventory with retro styling."""
+        # The report doesn't change while it is on screen
+        services_by_cost = sorted(billing_report['by_service'].items(), key=lambda x: x[1]['cost'], reverse=True)
+        categories_by_cost = sorted(billing_report['by_category'].items(), key=lambda x: x[1], reverse=True)
+        
         while True:
             self.terminal.clear_screen()
             
@@ -507,20 +675,19 @@ class RetroUI:
             
             for stat in stats:
                 self.terminal.move_cursor(5, y)
-                print(f"{self.colors.info}{stat}{Color.RESET}")
+                self.terminal.write(f"{self.colors.info}{stat}{Color.RESET}")
                 y += 1
             
             # Cost by service
             y += 1
             self.terminal.move_cursor(5, y)
-            print(f"{self.colors.accent}COST BY SERVICE:{Color.RESET}")
+            self.terminal.write(f"{self.colors.accent}COST BY SERVICE:{Color.RESET}")
             y += 1
             
-            for service, data in sorted(billing_report['by_service'].items(), 
-                                      key=lambda x: x[1]['cost'], reverse=True):
+            for service, data in services_by_cost:
                 self.terminal.move_cursor(7, y)
                 cost_bar = self._create_cost_bar(data['cost'], billing_report['total_estimated_monthly_cost'], 30)
-                print(f"{self.colors.success}{service.upper():<12} ${data['cost']:>8.2f} {cost_bar} ({data['count']} resources){Color.RESET}")
+                self.terminal.write(f"{self.colors.success}{service.upper():<12} ${data['cost']:>8.2f} {cost_bar} ({data['count']} resources){Color.RESET}")
                 y += 1
                 if y >= self.terminal.height - 8:
                     break
@@ -529,14 +696,13 @@ class RetroUI:
             y += 2
             if y < self.terminal.height - 6:
                 self.terminal.move_cursor(5, y)
-                print(f"{self.colors.accent}COST BY CATEGORY:{Color.RESET}")
+                self.terminal.write(f"{self.colors.accent}COST BY CATEGORY:{Color.RESET}")
                 y += 1
                 
-                for category, cost in sorted(billing_report['by_category'].items(), 
-                                           key=lambda x: x[1], reverse=True):
+                for category, cost in categories_by_cost:
                     self.terminal.move_cursor(7, y)
                     cost_bar = self._create_cost_bar(cost, billing_report['total_estimated_monthly_cost'], 20)
-                    print(f"{self.colors.warning}{category:<12} ${cost:>8.2f} {cost_bar}{Color.RESET}")
+                    self.terminal.write(f"{self.colors.warning}{category:<12} ${cost:>8.2f} {cost_bar}{Color.RESET}")
                     y += 1
                     if y >= self.terminal.height - 4:
                         break
@@ -545,7 +711,7 @@ class RetroUI:
             controls = ["1 Detailed View", "2 Top Costs", "3 Export", "ESC Back"]
             control_text = " | ".join(controls)
             self.terminal.move_cursor(5, self.terminal.height - 2)
-            print(f"{self.colors.info}{control_text}{Color.RESET}")
+            self.terminal.write(f"{self.colors.info}{control_text}{Color.RESET}")
             
             # Handle input
             key = self.terminal.get_key()
@@ -559,13 +725,20 @@ class RetroUI:
             elif key == 'ESCAPE':
                 return None
     
+    def _cost_color(self, monthly_cost: float) -> str:
+        """Color for a monthly cost: error above $100, warning above $10, success otherwise."""
+        if monthly_cost > 100:
+            return self.colors.error
+        elif monthly_cost > 10:
+            return self.colors.warning
+        return self.colors.success
+    
     def _create_cost_bar(self, cost: float, max_cost: float, width: int) -> str:
         """Create a visual cost bar."""
         if max_cost == 0:
-            return "░" * width
+            return _bar(0, width)
         
-        filled = int((cost / max_cost) * width)
-        return "█" * filled + "░" * (width - filled)
+        return _bar(int((cost / max_cost) * width), width)
     
     def _show_detailed_billing_view(self, billing_report: Dict, resources: List['AWSResource']):
         """Show detailed billing information for each resource."""
@@ -578,63 +751,56 @@ class RetroUI:
         # Sort by cost descending
         billing_resources.sort(key=lambda r: r.estimated_monthly_cost, reverse=True)
         
+        # Row text and cost color only depend on the resource, so work them out once per visit
+        rows = [
+            (self._cost_color(r.estimated_monthly_cost),
+             BILLING_ROW_FORMAT % (r.service, r.resource_type, r.display_name, f"${r.estimated_monthly_cost:.2f}",
+                                   r.billing_info.pricing_model if r.billing_info else "unknown"))
+            for r in billing_resources
+        ]
+        
         page_size = self.terminal.height - 12
         current_page = 0
         max_pages = (len(billing_resources) - 1) // page_size + 1
+        page_totals = [
+            sum(r.estimated_monthly_cost for r in billing_resources[start:start + page_size])
+            for start in range(0, len(billing_resources), page_size)
+        ]
         selected_index = 0
         
+        # Column headers and controls are the same on every page
+        header = (
+            self.terminal.at(5, 4, f"{self.colors.accent}{'SERVICE':<12} {'TYPE':<20} {'NAME':<25} {'MONTHLY COST':<15} {'MODEL':<12}{Color.RESET}") +
+            self.terminal.at(5, 5, f"{self.colors.border}{'-' * (self.terminal.width - 10)}{Color.RESET}")
+        )
+        controls = ["↑↓ Navigate", "ENTER Details", "PgUp/PgDn Pages", "ESC Back"]
+        control_text = " | ".join(controls)
+        footer = self.terminal.at(5, self.terminal.height - 2, f"{self.colors.info}{control_text}{Color.RESET}")
+        
+        self._frame = None
         while True:
-            self.terminal.clear_screen()
-            
             title = f"DETAILED BILLING VIEW (Page {current_page + 1}/{max_pages})"
-            self._draw_box(2, 2, self.terminal.width - 4, self.terminal.height - 4, title)
-            
-            # Column headers
-            self.terminal.move_cursor(5, 4)
-            print(f"{self.colors.accent}{'SERVICE':<12} {'TYPE':<20} {'NAME':<25} {'MONTHLY COST':<15} {'MODEL':<12}{Color.RESET}")
-            self.terminal.move_cursor(5, 5)
-            print(f"{self.colors.border}{'-' * (self.terminal.width - 10)}{Color.RESET}")
+            background = _render_box(2, 2, self.terminal.width - 4, self.terminal.height - 4, title, self.colors.border) + header + footer
             
             # Resource list
             start_idx = current_page * page_size
             end_idx = min(start_idx + page_size, len(billing_resources))
             
-            for i in range(start_idx, end_idx):
-                resource = billing_resources[i]
-                y = 6 + (i - start_idx)
-                x = 5
-                
-                billing = resource.billing_info
-                cost_str = f"${resource.estimated_monthly_cost:.2f}"
-                model = billing.pricing_model if billing else "unknown"
-                
+            frame_rows = {}
+            for i, (color, body) in enumerate(rows[start_idx:end_idx], start_idx):
                 if i == selected_index:
-                    line = f"{self.colors.menu_selected}▶ {resource.service:<11} {resource.resource_type:<19} {resource.display_name[:24]:<24} {cost_str:<15} {model:<12}{Color.RESET}"
+                    line = self._selected_prefix + body + Color.RESET
                 else:
                     # Color code by cost level
-                    if resource.estimated_monthly_cost > 100:
-                        color = self.colors.error
-                    elif resource.estimated_monthly_cost > 10:
-                        color = self.colors.warning
-                    else:
-                        color = self.colors.success
-                    
-                    line = f"{color}  {resource.service:<11} {resource.resource_type:<19} {resource.display_name[:24]:<24} {cost_str:<15} {model:<12}{Color.RESET}"
+                    line = color + "  " + body + Color.RESET
                 
-                self.terminal.move_cursor(x, y)
-                print(line)
+                frame_rows[(5, 6 + (i - start_idx))] = line
             
             # Summary
-            summary_y = self.terminal.height - 6
-            self.terminal.move_cursor(5, summary_y)
-            page_total = sum(r.estimated_monthly_cost for r in billing_resources[start_idx:end_idx])
-            print(f"{self.colors.info}Page Total: ${page_total:.2f} | Overall Total: ${billing_report['total_estimated_monthly_cost']:.2f}{Color.RESET}")
+            page_total = page_totals[current_page]
+            frame_rows[(5, self.terminal.height - 6)] = f"{self.colors.info}Page Total: ${page_total:.2f} | Overall Total: ${billing_report['total_estimated_monthly_cost']:.2f}{Color.RESET}"
             
-            # Controls
-            controls = ["↑↓ Navigate", "ENTER Details", "PgUp/PgDn Pages", "ESC Back"]
-            control_text = " | ".join(controls)
-            self.terminal.move_cursor(5, self.terminal.height - 2)
-            print(f"{self.colors.info}{control_text}{Color.RESET}")
+            self._draw_frame(background, frame_rows)
             
             # Handle input
             key = self.terminal.get_key()
@@ -650,6 +816,7 @@ class RetroUI:
             elif key == 'ENTER':
                 if selected_index < len(billing_resources):
                     self._show_resource_billing_details(billing_resources[selected_index])
+                    self._frame = None
             elif key == 'ESCAPE':
                 break
             elif key in ['PAGE_UP', 'b']:
@@ -671,23 +838,18 @@ class RetroUI:
             cost = f"${resource.estimated_monthly_cost:.2f}/month"
             
             # Color by cost level
-            if resource.estimated_monthly_cost > 100:
-                color = self.colors.error
-            elif resource.estimated_monthly_cost > 10:
-                color = self.colors.warning
-            else:
-                color = self.colors.success
+            color = self._cost_color(resource.estimated_monthly_cost)
             
             self.terminal.move_cursor(5, y)
-            print(f"{color}{i+1:2d}. {resource.service}/{resource.resource_type:<20} {resource.display_name[:30]:<30} {cost}{Color.RESET}")
+            self.terminal.write(f"{color}{i+1:2d}. {resource.service}/{resource.resource_type:<20} {resource.display_name[:30]:<30} {cost}{Color.RESET}")
         
         if len(top_resources) > 15:
             self.terminal.move_cursor(5, 20)
             remaining_cost = sum(r.estimated_monthly_cost for r in top_resources[15:])
-            print(f"{self.colors.info}... and {len(top_resources) - 15} more resources (${remaining_cost:.2f}/month){Color.RESET}")
+            self.terminal.write(f"{self.colors.info}... and {len(top_resources) - 15} more resources (${remaining_cost:.2f}/month){Color.RESET}")
         
         self.terminal.move_cursor(5, self.terminal.height - 2)
-        print(f"{self.colors.info}Press any key to continue...{Color.RESET}")
+        self.terminal.write(f"{self.colors.info}Press any key to continue...{Color.RESET}")
         
         self.terminal.get_key()
     
@@ -701,7 +863,7 @@ class RetroUI:
         billing = resource.billing_info
         if not billing:
             self.terminal.move_cursor(5, 4)
-            print(f"{self.colors.warning}No billing information available for this resource.{Color.RESET}")
+            self.terminal.write(f"{self.colors.warning}No billing information available for this resource.{Color.RESET}")
             self.terminal.get_key()
             return
         
@@ -723,15 +885,21 @@ class RetroUI:
             for key, value in billing.usage_metrics.items():
                 details.append(f"  {key}: {value}")
         
-        for i, line in enumerate(details):
-            if i < self.terminal.height - 6:
-                self.terminal.move_cursor(5, 4 + i)
-                if "Monthly Cost" in line:
-                    print(f"{self.colors.accent}{line}{Color.RESET}")
-                else:
-                    print(f"{self.colors.info}{line}{Color.RESET}")
+        # Colors carry over cursor moves, so each color is set once for its run of lines
+        at = self.terminal.at
+        accent, info = self.colors.accent, self.colors.info
+        parts = []
+        current = None
+        for i, line in enumerate(details[:self.terminal.height - 6]):
+            color = accent if 'Monthly Cost' in line else info
+            if color != current:
+                parts.append(Color.RESET + color if current else color)
+                current = color
+            parts.append(at(5, 4 + i, line))
+        parts.append(Color.RESET)
+        self.terminal.write(''.join(parts))
         
         self.terminal.move_cursor(5, self.terminal.height - 2)
-        print(f"{self.colors.info}Press any key to continue...{Color.RESET}")
+        self.terminal.write(f"{self.colors.info}Press any key to continue...{Color.RESET}")
         
         self.terminal.get_key()
\ No newline at end of file
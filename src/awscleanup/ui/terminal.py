@@ -2,203 +2,417 @@
 Terminal utilities for 80s-style interface.
 """
 
+import atexit
+import codecs
+import math
 import os
+import re
+import select
+import shutil
+import signal
 import sys
 import termios
 import tty
 import time
+import unicodedata
 import random
 from typing import Tuple, List, Optional
 
 
+# DEC private mode 2026: terminals that support it show everything between these
+# at once instead of painting a half-drawn frame; others ignore the sequences
+SYNC_UPDATE_BEGIN = '\033[?2026h'
+SYNC_UPDATE_END = '\033[?2026l'
+
+# One key from a burst of input: a whole CSI or SS3 escape sequence, or a single character
+KEY_RE = re.compile(r'\033\[[0-9;]*[@-~]|\033O[A-Z]|.', re.DOTALL)
+
+# One typed character for typewriter_print, along with the escape sequences around it
+TYPED_UNIT_RE = re.compile(r'(?:\033\[[0-9;?]*[A-Za-z])*.(?:\033\[[0-9;?]*[A-Za-z])*', re.DOTALL)
+
+# Glyphs for matrix_rain, and those of them that take two columns on screen
+MATRIX_CHARS = tuple("01アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン")
+MATRIX_WIDE_CHARS = frozenset(c for c in MATRIX_CHARS if unicodedata.east_asian_width(c) in 'WF')
+
+# Names for the keys get_key does not return as typed
+KEY_NAMES = {
+    '\033[A': 'UP', '\033OA': 'UP',
+    '\033[B': 'DOWN', '\033OB': 'DOWN',
+    '\033[C': 'RIGHT', '\033OC': 'RIGHT',
+    '\033[D': 'LEFT', '\033OD': 'LEFT',
+    '\033[H': 'HOME',
+    '\033[F': 'END',
+    '\033[5~': 'PAGE_UP',
+    '\033[6~': 'PAGE_DOWN',
+    '\n': 'ENTER', '\r': 'ENTER',
+    '\x7f': 'BACKSPACE', '\x08': 'BACKSPACE',
+    '\033': 'ESCAPE',
+    ' ': 'SPACE',
+    '\t': 'TAB',
+    '\x03': 'CTRL_C',
+    '\x11': 'CTRL_Q',
+}
+
+
 class Terminal:
     """Terminal control utilities."""
     
+    # Pending output for the current frame; written to stdout in one go by flush()
+    _buffer: List[str] = []
+    # Bumped on every clear so differential redraws know the screen was wiped
+    clear_count = 0
+    # Visibility changes are only sent when they actually change something
+    cursor_hidden = False
+    # Synchronized update sequences are only meant for a terminal, not a redirected file
+    synchronized_output = sys.stdout.isatty()
+    # (columns, lines); dropped on SIGWINCH and looked up again on next use
+    _size: Optional[Tuple[int, int]] = None
+    # Keys read together with the last one (fast typing, a paste), for the next get_key
+    _pending_input = ''
+    # Keeps the bytes of a character split across two reads until the rest arrives
+    _input_decoder = None
+    # stdin's (normal, cbreak, raw) termios attributes, worked out on first use
+    _input_modes = None
+    
     def __init__(self):
-        self.width, self.height = self.get_terminal_size()
+        try:
+            signal.signal(signal.SIGWINCH, self._on_resize)
+        except (AttributeError, ValueError):
+            # No SIGWINCH on this platform, or not on the main thread; keep the first size
+            pass
+    
+    @classmethod
+    def _on_resize(cls, signum, frame):
+        """Forget the cached size when the terminal is resized."""
+        cls._size = None
+    
+    @classmethod
+    def size(cls) -> Tuple[int, int]:
+        """Get terminal dimensions, cached until the next resize."""
+        if cls._size is None:
+            cls._size = cls.get_terminal_size()
+        return cls._size
+    
+    @property
+    def width(self) -> int:
+        return self.size()[0]
+    
+    @property
+    def height(self) -> int:
+        return self.size()[1]
     
     @staticmethod
     def get_terminal_size() -> Tuple[int, int]:
         """Get terminal dimensions."""
-        try:
-            size = os.get_terminal_size()
-            return size.columns, size.lines
-        except Exception:
-            return 80, 24  # fallback
+        # Honours COLUMNS/LINES, and falls back to 80x24 when stdout is not a terminal
+        size = shutil.get_terminal_size((80, 24))
+        return size.columns, size.lines
     
-    @staticmethod
-    def clear_screen():
-        """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+    @classmethod
+    def write(cls, text: str):
+        """Queue text for the current frame."""
+        cls._buffer.append(text)
+    
+    @classmethod
+    def flush(cls):
+        """Write the queued frame to the terminal with a single write."""
+        if cls._buffer:
+            frame = ''.join(cls._buffer)
+            if cls.synchronized_output:
+                frame = SYNC_UPDATE_BEGIN + frame + SYNC_UPDATE_END
+            cls._buffer.clear()
+            # Anything print()ed directly has to reach the screen before this frame
+            sys.stdout.flush()
+            try:
+                fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):
+                # Not backed by a file descriptor; go through the text layer
+                sys.stdout.write(frame)
+            else:
+                # Encode once and hand the bytes straight to the descriptor
+                data = memoryview(frame.encode(sys.stdout.encoding or 'utf-8'))
+                while data:
+                    data = data[os.write(fd, data):]
+        sys.stdout.flush()
+    
+    @classmethod
+    def clear_screen(cls):
+        """Clear the terminal screen as part of the frame being queued."""
+        cls.write('\033[2J\033[H')
+        cls.clear_count += 1
     
     @staticmethod
-    def move_cursor(x: int, y: int):
+    def at(x: int, y: int, text: str = '') -> str:
+        """Return text prefixed with the escape sequence that positions it at (x, y)."""
+        return f'\033[{y};{x}H{text}'
+    
+    @classmethod
+    def move_cursor(cls, x: int, y: int):
         """Move cursor to position."""
-        print(f'\033[{y};{x}H', end='')
+        cls.write(cls.at(x, y))
     
-    @staticmethod
-    def hide_cursor():
+    @classmethod
+    def hide_cursor(cls):
         """Hide the cursor."""
-        print('\033[?25l', end='')
+        if not cls.cursor_hidden:
+            cls.write('\033[?25l')
+            cls.cursor_hidden = True
     
-    @staticmethod
-    def show_cursor():
+    @classmethod
+    def show_cursor(cls):
         """Show the cursor."""
-        print('\033[?25h', end='')
+        if cls.cursor_hidden:
+            cls.write('\033[?25h')
+            cls.cursor_hidden = False
     
-    @staticmethod
-    def save_cursor():
+    @classmethod
+    def save_cursor(cls):
         """Save cursor position."""
-        print('\033[s', end='')
+        cls.write('\033[s')
     
-    @staticmethod
-    def restore_cursor():
+    @classmethod
+    def restore_cursor(cls):
         """Restore cursor position."""
-        print('\033[u', end='')
+        cls.write('\033[u')
     
-    @staticmethod
-    def get_key() -> str:
-        """Get a single keypress."""
+    @classmethod
+    def _get_input_modes(cls, fd: int) -> Tuple[list, list, list]:
+        """Return stdin's normal, cbreak and raw terminal attributes, reading them only once."""
+        if cls._input_modes is None:
+            normal = termios.tcgetattr(fd)
+            # The same changes tty.setcbreak and tty.setraw make, without applying them
+            cbreak = normal[:tty.CC] + [normal[tty.CC][:]]
+            cbreak[tty.LFLAG] &= ~(termios.ECHO | termios.ICANON)
+            cbreak[tty.CC][termios.VMIN] = 1
+            cbreak[tty.CC][termios.VTIME] = 0
+            raw = normal[:tty.CC] + [normal[tty.CC][:]]
+            raw[tty.IFLAG] &= ~(termios.BRKINT | termios.ICRNL | termios.INPCK | termios.ISTRIP | termios.IXON)
+            raw[tty.OFLAG] &= ~termios.OPOST
+            raw[tty.CFLAG] &= ~(termios.CSIZE | termios.PARENB)
+            raw[tty.CFLAG] |= termios.CS8
+            raw[tty.LFLAG] &= ~(termios.ECHO | termios.ICANON | termios.IEXTEN | termios.ISIG)
+            raw[tty.CC][termios.VMIN] = 1
+            raw[tty.CC][termios.VTIME] = 0
+            cls._input_modes = (normal, cbreak, raw)
+        return cls._input_modes
+    
+    @classmethod
+    def wait_for_key(cls, timeout: float) -> bool:
+        """Wait up to timeout seconds for a keypress, consuming it; return whether one came."""
+        cls.flush()
         try:
             fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
+            normal, cbreak, _ = cls._get_input_modes(fd)
+            termios.tcsetattr(fd, termios.TCSANOW, cbreak)
             try:
-                # Try to use cbreak mode for single character input
-                if hasattr(tty, 'cbreak'):
-                    tty.cbreak(fd)
-                else:
-                    # Fallback for systems without cbreak
-                    tty.setraw(fd)
-                
-                key = sys.stdin.read(1)
-                
-                # Handle special keys (arrows, etc.)
-                if key == '\033':  # ESC sequence
-                    try:
-                        key += sys.stdin.read(2)
-                    except:
-                        return 'ESCAPE'
-                    
-                    if key == '\033[A':
-                        return 'UP'
-                    elif key == '\033[B':
-                        return 'DOWN'
-                    elif key == '\033[C':
-                        return 'RIGHT'
-                    elif key == '\033[D':
-                        return 'LEFT'
-                    elif key == '\033[H':
-                        return 'HOME'
-                    elif key == '\033[F':
-                        return 'END'
-                elif key == '\n' or key == '\r':
-                    return 'ENTER'
-                elif key == '\x7f' or key == '\x08':
-                    return 'BACKSPACE'
-                elif key == '\x1b':
-                    return 'ESCAPE'
-                elif key == ' ':
-                    return 'SPACE'
-                elif key == '\t':
-                    return 'TAB'
-                elif ord(key) == 3:  # Ctrl+C
-                    return 'CTRL_C'
-                elif ord(key) == 17:  # Ctrl+Q
-                    return 'CTRL_Q'
-                
-                return key
+                ready, _, _ = select.select([fd], [], [], timeout)
+                if ready:
+                    # Swallow the whole key, including any escape sequence
+                    os.read(fd, 32)
+                return bool(ready)
             finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        except (ImportError, AttributeError, OSError):
-            # Fallback for systems without termios/tty support
-            return input("Press Enter to continue: ").strip() or 'ENTER'
+                termios.tcsetattr(fd, termios.TCSADRAIN, normal)
+        except (AttributeError, OSError, termios.error):
+            # No interactive terminal to watch; just wait
+            time.sleep(timeout)
+            return False
+    
+    @classmethod
+    def get_key(cls) -> str:
+        """Get a single keypress."""
+        # Everything drawn so far must be on screen before blocking for input
+        cls.flush()
+        if cls._input_decoder is None:
+            # Bytes that aren't valid in the input encoding (8-bit meta keys) are dropped
+            cls._input_decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')('ignore')
+        
+        # A read may hold nothing decodable yet, so keep reading until a key comes out
+        while not cls._pending_input:
+            try:
+                fd = sys.stdin.fileno()
+                normal, _, raw = cls._get_input_modes(fd)
+                # TCSANOW rather than tty.setraw's TCSAFLUSH, so keys typed ahead are kept
+                termios.tcsetattr(fd, termios.TCSANOW, raw)
+                try:
+                    # Everything waiting in one read, so escape sequences arrive whole
+                    data = os.read(fd, 32)
+                finally:
+                    termios.tcsetattr(fd, termios.TCSADRAIN, normal)
+            except (ImportError, AttributeError, OSError, termios.error):
+                # Fallback for systems without termios/tty support
+                return input("Press Enter to continue: ").strip() or 'ENTER'
+            
+            if not data:
+                # End of input; back out of whatever is waiting
+                return 'ESCAPE'
+            cls._pending_input = cls._input_decoder.decode(data)
+        return cls._next_key()
+    
+    @classmethod
+    def _next_key(cls) -> str:
+        """Take the first key off the pending input, by name if it has one."""
+        key = KEY_RE.match(cls._pending_input).group()
+        cls._pending_input = cls._pending_input[len(key):]
+        return KEY_NAMES.get(key, key)
+
+
+@atexit.register
+def _restore_cursor():
+    """Never leave the shell with a hidden cursor, whichever way the program exits."""
+    if Terminal.cursor_hidden:
+        Terminal.show_cursor()
+        Terminal.flush()
+
+
+def _sample_indices(count: int, probability: float) -> set:
+    """Pick each index below count independently with the given probability.
+    
+    Rather than one random number per index, the gaps between picked indices are
+    drawn from the matching geometric distribution, so only the picks cost a draw.
+    """
+    if probability >= 1:
+        return set(range(count))
+    if probability <= 0:
+        return set()
+    log_skip = math.log(1.0 - probability)
+    picked = set()
+    index = int(math.log(1.0 - random.random()) / log_skip)
+    while index < count:
+        picked.add(index)
+        index += 1 + int(math.log(1.0 - random.random()) / log_skip)
+    return picked
 
 
 class RetroEffects:
     """80s-style visual effects."""
     
     @staticmethod
-    def typewriter_print(text: str, delay: float = 0.03):
-        """Print text with typewriter effect."""
-        for char in text:
-            print(char, end='', flush=True)
-            time.sleep(delay)
-        print()
+    def typewriter_print(text: str, delay: float = 0.03, chunk: int = 4):
+        """Print text with typewriter effect, chunk characters per write."""
+        if delay <= 0:
+            Terminal.write(text + '\n')
+            Terminal.flush()
+            return
+        # Color codes are sent along with a character rather than typed out themselves
+        units = TYPED_UNIT_RE.findall(text)
+        for i in range(0, len(units), chunk):
+            group = units[i:i + chunk]
+            Terminal.write(''.join(group))
+            Terminal.flush()
+            time.sleep(delay * len(group))
+        Terminal.write('\n')
+        Terminal.flush()
     
     @staticmethod
     def matrix_rain(width: int, height: int, duration: float = 3.0):
-        """Create matrix-style falling characters effect."""
-        chars = "01アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン"
+        """Create matrix-style falling characters effect; any keypress ends it early."""
         
-        # Initialize columns
+        # A glyph dims by the same factor each time it falls a row, so its color
+        # follows from the row it has reached; a whole row shares one color
+        shades = []
+        for y in range(height):
+            brightness = 0.95 ** y
+            if brightness > 0.7:
+                shades.append('\033[92m')
+            elif brightness > 0.4:
+                shades.append('\033[32m')
+            else:
+                shades.append('\033[90m')
+        
+        # What goes before each row of a frame: its position, and its color where it
+        # differs from the row above (colors carry over cursor moves)
+        row_starts = [
+            Terminal.at(1, y + 1, shade if y == 0 or shade != shades[y - 1] else '')
+            for y, shade in enumerate(shades)
+        ]
+        
+        # Initialize columns; rows and glyphs are parallel lists, newest first
+        start_time = time.monotonic()
         columns = []
         for _ in range(width):
             columns.append({
-                'chars': [],
+                'ys': [],
+                'glyphs': [],
                 'speed': random.uniform(0.1, 0.3),
-                'last_update': time.time()
+                'last_update': start_time
             })
         
-        start_time = time.time()
         Terminal.hide_cursor()
         
         try:
-            while time.time() - start_time < duration:
-                Terminal.clear_screen()
+            # Every frame repaints the whole screen, so it only needs clearing once
+            Terminal.clear_screen()
+            while True:
+                # One clock reading per frame, shared by every column
+                now = time.monotonic()
+                if now - start_time >= duration:
+                    break
+                grid = [[' '] * width for _ in range(height)]
+                spawning = _sample_indices(width, 0.1)
                 
                 for col_idx, column in enumerate(columns):
-                    current_time = time.time()
+                    ys = column['ys']
+                    glyphs = column['glyphs']
                     
                     # Add new characters at top
-                    if random.random() < 0.1:
-                        column['chars'].insert(0, {
-                            'char': random.choice(chars),
-                            'y': 0,
-                            'brightness': 1.0
-                        })
+                    if col_idx in spawning:
+                        ys.insert(0, 0)
+                        glyphs.insert(0, random.choice(MATRIX_CHARS))
                     
                     # Update character positions
-                    if current_time - column['last_update'] > column['speed']:
-                        for char_data in column['chars']:
-                            char_data['y'] += 1
-                            char_data['brightness'] *= 0.95
+                    if now - column['last_update'] > column['speed']:
+                        column['ys'] = ys = [y + 1 for y in ys]
                         
-                        # Remove characters that fell off screen
-                        column['chars'] = [c for c in column['chars'] if c['y'] < height]
-                        column['last_update'] = current_time
+                        # Everything falls together, so characters leave the screen from the end
+                        while ys and ys[-1] >= height:
+                            ys.pop()
+                            glyphs.pop()
+                        column['last_update'] = now
                     
-                    # Draw characters
-                    for char_data in column['chars']:
-                        if 0 <= char_data['y'] < height:
-                            Terminal.move_cursor(col_idx + 1, char_data['y'] + 1)
-                            brightness = max(0, min(1, char_data['brightness']))
-                            if brightness > 0.7:
-                                print(f'\033[92m{char_data["char"]}\033[0m', end='')
-                            elif brightness > 0.4:
-                                print(f'\033[32m{char_data["char"]}\033[0m', end='')
-                            else:
-                                print(f'\033[90m{char_data["char"]}\033[0m', end='')
+                    # Place characters in the frame
+                    for y, glyph in zip(ys, glyphs):
+                        row = grid[y]
+                        if not row[col_idx]:
+                            # Covered by the right half of a wide glyph to the left
+                            continue
+                        if glyph in MATRIX_WIDE_CHARS:
+                            if col_idx + 1 == width:
+                                continue
+                            # Two columns wide, so the next cell drops out of the row
+                            row[col_idx + 1] = ''
+                        row[col_idx] = glyph
                 
-                time.sleep(0.05)
+                # One run per row; blanks overwrite the previous frame's glyphs
+                Terminal.write(''.join(start + ''.join(row) for start, row in zip(row_starts, grid)) + '\033[0m')
+                
+                # Pause between frames while listening for a key to skip the rest
+                if Terminal.wait_for_key(0.05):
+                    break
         finally:
             Terminal.show_cursor()
+            Terminal.flush()
     
     @staticmethod
     def scan_lines(width: int, height: int, duration: float = 2.0):
         """Create scan line effect."""
-        start_time = time.time()
+        start_time = time.monotonic()
         Terminal.hide_cursor()
         
         try:
-            while time.time() - start_time < duration:
+            # One glyph repeated across the row (REP), and the row blanked again in
+            # place (ECH), rather than a full row of characters each way
+            line = f'\033[90m█\033[{width - 1}b\033[0m'
+            erase = f'\033[{width}X'
+            while time.monotonic() - start_time < duration:
                 for y in range(height):
-                    Terminal.move_cursor(1, y + 1)
-                    print('\033[90m' + '█' * width + '\033[0m')
+                    Terminal.write(Terminal.at(1, y + 1, line))
+                    Terminal.flush()
                     time.sleep(duration / height)
-                    Terminal.move_cursor(1, y + 1)
-                    print(' ' * width)
+                    # Goes out together with the next row's line
+                    Terminal.write(Terminal.at(1, y + 1, erase))
         finally:
             Terminal.show_cursor()
+            Terminal.flush()
     
     @staticmethod
     def glitch_text(text: str, intensity: float = 0.1) -> str:
@@ -207,12 +421,11 @@ class RetroEffects:
             return text
         
         glitch_chars = "!@#$%^&*(){}[]|\\:;\"'<>?/~`"
-        result = ""
+        result = list(text)
         
-        for char in text:
-            if char.isalnum() and random.random() < intensity:
-                result += random.choice(glitch_chars)
-            else:
-                result += char
+        # Only the picked positions cost a random draw
+        for i in _sample_indices(len(text), intensity):
+            if result[i].isalnum():
+                result[i] = random.choice(glitch_chars)
         
-        return result
\ No newline at end of file
+        return ''.join(result)
\ No newline at end of file
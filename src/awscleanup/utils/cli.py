@@ -3,22 +3,68 @@ Command line interface utilities.
 """
 
 import argparse
-import subprocess
+import atexit
+import logging
+import shutil
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 
 def check_aws_cli() -> bool:
     """Check if AWS CLI is available."""
+    # A PATH lookup is enough; running `aws --version` costs a whole CLI start-up
+    return shutil.which('aws') is not None
+
+
+class _OneLineFormatter(logging.Formatter):
+    """Log formatter that leaves tracebacks out, keeping each record to a single line."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        saved = record.exc_info, record.exc_text, record.stack_info
+        record.exc_info = record.exc_text = record.stack_info = None
+        try:
+            return super().format(record)
+        finally:
+            record.exc_info, record.exc_text, record.stack_info = saved
+
+
+class _DeferredStderrHandler(logging.Handler):
+    """Log handler that holds the latest records and prints them to stderr at exit."""
+    
+    def __init__(self, capacity: int = 100):
+        super().__init__()
+        self.lines = deque(maxlen=capacity)
+        # Anything written while the interface owns the screen would garble the frame
+        atexit.register(self.print_lines)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+    
+    def print_lines(self) -> None:
+        for line in self.lines:
+            print(line, file=sys.stderr)
+
+
+def setup_logging(log_file: Path) -> None:
+    """Send the tool's log records to log_file, away from the full-screen interface."""
+    logger = logging.getLogger('awscleanup')
+    logger.setLevel(logging.INFO)
     try:
-        subprocess.run(['aws', '--version'], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        log_file.parent.mkdir(exist_ok=True)
+        handler = logging.FileHandler(log_file)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    except OSError:
+        # No writable log file; show one line per record once the interface has exited
+        handler = _DeferredStderrHandler()
+        handler.setFormatter(_OneLineFormatter('%(levelname)s: %(message)s'))
+    logger.addHandler(handler)
 
 
+@lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
-    """Setup command line argument parser."""
+    """Setup command line argument parser; built once and shared, as parse_args leaves it unchanged."""
     parser = argparse.ArgumentParser(
         description='AWS Resource Cleanup Tool - Retro Edition',
         formatter_class=argparse.RawDescriptionHelpFormatter,